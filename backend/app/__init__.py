@@ -14,9 +14,14 @@ from .analytics.router import router as analytics_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from anyio import to_thread
     from google import generativeai as genai
 
     print("Application startup...")
+    # Sync (def) endpoints run on AnyIO's worker threadpool, which defaults to
+    # 40 threads. The timer UI polls /sessions/active once per second per
+    # user, so raise the cap to keep concurrent pollers from queueing.
+    to_thread.current_default_thread_limiter().total_tokens = 100
     create_db_and_tables()
     genai.configure(api_key=settings.gemini_api_key)
     yield
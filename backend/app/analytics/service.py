@@ -12,14 +12,34 @@ class AnalyticsService:
     """Service for handling analytics operations"""
     
     @staticmethod
-    def log_event(db: SessionDep, user_id: int, event_type: str, event_data: Optional[Dict[str, Any]] = None):
-        """Log an analytics event"""
-        event = AnalyticsEvent(
+    def build_event(user_id: int, event_type: str, event_data: Optional[Dict[str, Any]] = None) -> AnalyticsEvent:
+        """Build an analytics event row without touching the database.
+
+        Callers that log several events per request add these to their own
+        session and flush them in the request's final commit instead of
+        paying one commit per event.
+        """
+        return AnalyticsEvent(
             user_id=user_id,
             event_type=event_type,
             event_data=json.dumps(event_data) if event_data else None
         )
+
+    @staticmethod
+    def queue_event(db: SessionDep, user_id: int, event_type: str, event_data: Optional[Dict[str, Any]] = None):
+        """Add an event to the session without committing.
+
+        Endpoints that already commit at the end of the request use this so
+        all their events ride along in that single commit.
+        """
+        event = AnalyticsService.build_event(user_id, event_type, event_data)
         db.add(event)
+        return event
+
+    @staticmethod
+    def log_event(db: SessionDep, user_id: int, event_type: str, event_data: Optional[Dict[str, Any]] = None):
+        """Log an analytics event"""
+        event = AnalyticsService.queue_event(db, user_id, event_type, event_data)
         db.commit()
         return event
     
@@ -66,6 +86,22 @@ class AnalyticsService:
         db.commit()
         return session_analytics
     
+    @staticmethod
+    def update_session_analytics_background(session_id: int, **kwargs):
+        """update_session_analytics variant for fastapi.BackgroundTasks.
+
+        Opens its own session, so the aggregate maintenance runs after the
+        response is sent instead of inside the request's latency budget.
+        """
+        from sqlmodel import Session
+
+        from ..db import engine
+
+        with Session(engine) as db:
+            AnalyticsService.update_session_analytics(
+                db=db, session_id=session_id, **kwargs
+            )
+
     @staticmethod
     def update_session_analytics(db: SessionDep, session_id: int, **kwargs):
         """Update session analytics with new data"""
@@ -1,5 +1,6 @@
 from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
+from sqlalchemy import Index
 from sqlmodel import Field as SQLField, SQLModel, Relationship
 
 if TYPE_CHECKING:
@@ -73,12 +74,24 @@ class ActivePomodoroSession(SQLModel, table=True):
 
 
 class Task(SQLModel, table=True):
+    # Composite indexes back the per-session completed-task counts and the
+    # ordered per-session task listings; the completed_at index backs the
+    # daily-progress date-range filters.
+    __table_args__ = (
+        Index("ix_task_session_completed", "session_id", "completed"),
+        Index("ix_task_completed_at", "completed_at"),
+        Index("ix_task_session_order", "session_id", "order"),
+    )
     id: Optional[int] = SQLField(default=None, primary_key=True)
     name: str = SQLField(index=True)
     session_id: Optional[int] = SQLField(
         default=None, foreign_key="session.id", index=True
     )
     estimated_completion_time: int
+    # Denormalized copy of the first category's name: every read path returns
+    # exactly one category, so responses can skip the m2m join entirely.
+    # Kept in sync by the task create/update endpoints.
+    primary_category_name: Optional[str] = None
     cognitive_load: int = SQLField(default=1)  # 1-5 scale
     suggested_break_duration: Optional[int] = None  # Dynamic break duration in minutes
     actual_completion_time: Optional[int] = None
@@ -102,6 +115,9 @@ class Task(SQLModel, table=True):
 
 class SessionFeedback(SQLModel, table=True):
     __tablename__ = "session_feedback"
+    # Backs the keyset-paginated feedback history (user_id filter ordered by
+    # created_at desc).
+    __table_args__ = (Index("ix_session_feedback_user_created", "user_id", "created_at"),)
     id: Optional[int] = SQLField(default=None, primary_key=True)
     session_id: int = SQLField(foreign_key="session.id", index=True)
     user_id: int = SQLField(foreign_key="user.id", index=True)
@@ -0,0 +1,28 @@
+import orjson
+from fastapi import Response
+
+# datetime/UUID are handled natively by orjson; OPT_UTC_Z keeps the wire
+# format identical to what clients already parse ("Z" suffix instead of
+# "+00:00") and OPT_SERIALIZE_NUMPY covers numpy scalars from analytics.
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """Fallback for the few types orjson doesn't serialize natively."""
+    if hasattr(obj, "_asdict"):  # SQLAlchemy Row
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered entirely by orjson.
+
+    Unlike fastapi.responses.ORJSONResponse this configures serializer
+    options once at module level and accepts SQLAlchemy Row objects, so
+    endpoints can hand over raw query results without an encoder walk.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
@@ -3,10 +3,25 @@ import json
 from google import generativeai as genai
 from app.config import settings
 
+_model = None
+
+
+def get_gemini_model() -> genai.GenerativeModel:
+    """Return a shared GenerativeModel, configuring the SDK on first use.
+
+    genai.configure and model construction only need to happen once per
+    process; rebuilding them on every request added avoidable latency to
+    each LLM call.
+    """
+    global _model
+    if _model is None:
+        genai.configure(api_key=settings.gemini_api_key)
+        _model = genai.GenerativeModel(settings.gemini_model)
+    return _model
+
 
 async def call_gemini_for_tasks(description: str) -> dict:
-    genai.configure(api_key=settings.gemini_api_key)
-    model = genai.GenerativeModel(settings.gemini_model)
+    model = get_gemini_model()
     prompt = f"""
     You are a project management assistant. Your task is to break down a user's goal into a list of smaller, actionable tasks.
     You must also suggest a standard Pomodoro timer configuration.
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+import time
+from functools import lru_cache
+from threading import Lock
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import case, delete, func, insert, lambda_stmt, update
+from sqlalchemy.exc import IntegrityError
 
 from ..db import SessionDep, get_session
-from ..models import PomodoroSession, Task, Category, ActivePomodoroSession, SessionFeedback
+from ..models import PomodoroSession, Task, Category, ActivePomodoroSession, SessionFeedback, TaskCategoryLink
 from .schemas import (
     SessionCreate,
     SessionWithTasksPublic,
@@ -24,14 +30,317 @@ from .schemas import (
     TaskReorder,
 )
 from sqlmodel import select
+from sqlalchemy.orm import joinedload, selectinload
 from ..auth.deps import ActiveUserDep
+from ..responses import ORJSONResponse
 from ..users.models import User
 from ..analytics.service import AnalyticsService
 
-router = APIRouter(prefix="/sessions", tags=["Sessions"])
+router = APIRouter(
+    prefix="/sessions", tags=["Sessions"], default_response_class=ORJSONResponse
+)
+
+
+def _task_payload(task: Task) -> dict:
+    """Plain-dict form of TaskPublic for direct ORJSONResponse serialization."""
+    return {
+        "id": task.id,
+        "name": task.name,
+        "estimated_completion_time": task.estimated_completion_time,
+        "category": task.primary_category_name or "Uncategorized",
+        "completed": task.completed,
+        "actual_completion_time": task.actual_completion_time,
+        "due_date": task.due_date,
+        "archived": task.archived,
+        "archived_at": task.archived_at,
+    }
+
+
+def _task_rows_payload(db, session_id: int, include_archived: bool) -> List[dict]:
+    """Task payloads for a session from one flat projection query.
+
+    Selecting plain columns skips ORM hydration and relationship loading
+    entirely — the rows map straight onto the response dicts, with the
+    category name coming from the denormalized Task column.
+    """
+    query = select(
+        Task.id,
+        Task.name,
+        Task.estimated_completion_time,
+        Task.primary_category_name,
+        Task.completed,
+        Task.actual_completion_time,
+        Task.due_date,
+        Task.archived,
+        Task.archived_at,
+    ).where(
+        Task.session_id == session_id,
+        Task.is_deleted == False  # noqa: E712
+    )
+    if not include_archived:
+        query = query.where(Task.archived == False)  # noqa: E712
+    rows = db.exec(query.order_by(Task.order)).all()
+    return [
+        {
+            "id": row[0],
+            "name": row[1],
+            "estimated_completion_time": row[2],
+            "category": row[3] or "Uncategorized",
+            "completed": row[4],
+            "actual_completion_time": row[5],
+            "due_date": row[6],
+            "archived": row[7],
+            "archived_at": row[8],
+        }
+        for row in rows
+    ]
+
+
+def _session_public(session: PomodoroSession) -> SessionPublic:
+    """SessionPublic built without re-validating trusted DB values."""
+    return SessionPublic.model_construct(
+        id=session.id,
+        name=session.name,
+        description=session.description,
+        focus_duration=session.focus_duration,
+        short_break_duration=session.short_break_duration,
+        long_break_duration=session.long_break_duration,
+        long_break_per_pomodoros=session.long_break_per_pomodoros,
+        archived=session.archived,
+        archived_at=session.archived_at,
+    )
+
+
+def _session_with_tasks_payload(session: PomodoroSession, tasks: List[dict]) -> dict:
+    """Plain-dict form of SessionWithTasksPublic."""
+    return {
+        "id": session.id,
+        "name": session.name,
+        "description": session.description,
+        "focus_duration": session.focus_duration,
+        "short_break_duration": session.short_break_duration,
+        "long_break_duration": session.long_break_duration,
+        "long_break_per_pomodoros": session.long_break_per_pomodoros,
+        "completed": session.completed,
+        "completed_at": session.completed_at,
+        "archived": session.archived,
+        "archived_at": session.archived_at,
+        "tasks": tasks,
+    }
+
+
+# Tiny in-process TTL cache for GET /sessions/active payloads, keyed by user
+# id. The frontend polls that endpoint once per timer tick, so even a short
+# TTL absorbs most of the read load. Every endpoint that mutates the active
+# session must call _invalidate_active_cache after committing.
+_ACTIVE_CACHE_TTL = 2.0
+_active_cache: dict = {}
+_active_cache_lock = Lock()
+
+
+def _get_cached_active_payload(user_id: int) -> Optional[dict]:
+    with _active_cache_lock:
+        entry = _active_cache.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_active_payload(user_id: int, payload: dict) -> None:
+    with _active_cache_lock:
+        _active_cache[user_id] = (time.monotonic() + _ACTIVE_CACHE_TTL, payload)
+
+
+def _invalidate_active_cache(user_id: int) -> None:
+    with _active_cache_lock:
+        _active_cache.pop(user_id, None)
+
+
+# Same idea for GET /sessions/daily-progress: the answer only changes when a
+# completion-affecting write lands, so cache (etag, payload) per user for a
+# short window and drop the entry from those write paths. The cached entry
+# remembers its date so a poll just after midnight never serves yesterday.
+_PROGRESS_CACHE_TTL = 60.0
+_progress_cache: dict = {}
+_progress_cache_lock = Lock()
+
+
+def _get_cached_progress(user_id: int, today: str) -> Optional[tuple]:
+    with _progress_cache_lock:
+        entry = _progress_cache.get(user_id)
+    if entry and entry[0] > time.monotonic() and entry[1] == today:
+        return entry[2], entry[3]
+    return None
+
+
+def _store_progress(user_id: int, today: str, etag: str, payload: dict) -> None:
+    with _progress_cache_lock:
+        _progress_cache[user_id] = (
+            time.monotonic() + _PROGRESS_CACHE_TTL,
+            today,
+            etag,
+            payload,
+        )
+
 
+def _invalidate_progress_cache(user_id: int) -> None:
+    with _progress_cache_lock:
+        _progress_cache.pop(user_id, None)
 
-@router.post("/", response_model=SessionWithTasksPublic)
+
+def _get_or_create_category(db, name: str) -> Category:
+    """Fetch a category by name, creating it on miss without a commit.
+
+    Category.name is UNIQUE and neither SQLite nor MySQL shares a portable
+    ON CONFLICT clause, so the insert runs in a savepoint and a concurrent
+    writer's row is re-read after an IntegrityError.
+    """
+    while True:
+        category = db.exec(select(Category).where(Category.name == name)).first()
+        if category:
+            return category
+        category = Category(name=name)
+        try:
+            with db.begin_nested():
+                db.add(category)
+            return category
+        except IntegrityError:
+            # A competing writer owns the name; loop to re-read its row. If
+            # that writer rolled back, the re-read misses and the insert is
+            # simply retried instead of returning None.
+            continue
+
+
+# Category name -> id cache for the task-mutation endpoints. Categories are
+# never renamed or deleted, so entries are effectively write-once. Only ids
+# read back from already-committed rows are cached: a freshly inserted id
+# could belong to a transaction that later rolls back, and link rows written
+# against it would dangle for the whole TTL.
+_CATEGORY_CACHE_TTL = 300.0
+_category_cache: dict = {}
+_category_cache_lock = Lock()
+
+
+def _category_id_for_name(db, name: str) -> int:
+    """Resolve a category name to its id, skipping the DB on cache hits."""
+    with _category_cache_lock:
+        entry = _category_cache.get(name)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    category = db.exec(select(Category).where(Category.name == name)).first()
+    if category is not None:
+        with _category_cache_lock:
+            _category_cache[name] = (
+                time.monotonic() + _CATEGORY_CACHE_TTL,
+                category.id,
+            )
+        return category.id
+    category = _get_or_create_category(db, name)
+    db.flush()  # assign the id for the caller's link-row insert; not cached
+    return category.id
+
+
+def _get_user_task(db, task_id: int, user_id: int) -> Optional[Task]:
+    """Load a live task owned by user_id in one join-filtered query.
+
+    Folds the old db.get(Task) + db.get(PomodoroSession) authorization pair
+    into a single SELECT. The response's category name comes from the
+    denormalized column, so no relationship load is attached.
+    """
+    return db.exec(
+        select(Task)
+        .join(PomodoroSession, Task.session_id == PomodoroSession.id)
+        .where(
+            Task.id == task_id,
+            Task.is_deleted == False,  # noqa: E712
+            PomodoroSession.user_id == user_id,
+        )
+    ).first()
+
+
+def _owned_session(db, session_id: int, user_id: int) -> Optional[PomodoroSession]:
+    """Fetch a session by id scoped to its owner in a single filtered query.
+
+    Filtering on user_id in SQL avoids materializing other users' rows just
+    to reject them in Python; a non-owned id simply returns no row.
+    """
+    return db.exec(
+        select(PomodoroSession).where(
+            PomodoroSession.id == session_id,
+            PomodoroSession.user_id == user_id,
+        )
+    ).first()
+
+
+def _owns_session(db, session_id: int, user_id: int) -> bool:
+    """Ownership check that fetches a single scalar instead of the row.
+
+    For endpoints that only need to authorize (not read or mutate the
+    session), hydrating the whole ORM object is wasted work.
+    """
+    return (
+        db.exec(
+            select(PomodoroSession.id).where(
+                PomodoroSession.id == session_id,
+                PomodoroSession.user_id == user_id,
+            )
+        ).first()
+        is not None
+    )
+
+
+def _active_session_for_user(db, user_id: int) -> Optional[ActivePomodoroSession]:
+    """Fetch the user's active session via a cached lambda statement.
+
+    The active-session endpoints run this exact query on every timer tick;
+    lambda_stmt lets SQLAlchemy reuse the compiled SQL across calls instead
+    of rebuilding and recompiling the select each time.
+    """
+    stmt = lambda_stmt(
+        lambda: select(ActivePomodoroSession).where(
+            ActivePomodoroSession.user_id == user_id
+        )
+    )
+    # one_or_none: user_id is unique, and saying so lets errors surface
+    return db.execute(stmt).scalars().one_or_none()
+
+
+def _active_session_payload(active_session: ActivePomodoroSession) -> dict:
+    """Plain-dict form of ActiveSessionPublic."""
+    return {
+        "id": active_session.id,
+        "session_id": active_session.session_id,
+        "current_task_id": active_session.current_task_id,
+        "is_running": active_session.is_running,
+        "time_remaining": active_session.time_remaining,
+        "phase": active_session.phase,
+        "pomodoros_completed": active_session.pomodoros_completed,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _generated_session_name(prompt: str) -> str:
+    """LLM-generated session name, cached on the exact prompt.
+
+    The prompt is deterministic for a given (description, task names)
+    tuple, so repeat requests skip the Gemini roundtrip entirely.
+    Failures propagate and are not cached.
+    """
+    from google.api_core.retry import Retry
+
+    from ..services.llm import get_gemini_model
+
+    # Bound both the per-attempt timeout and the retry's overall deadline:
+    # the SDK's default retry keeps attempting for up to 600s when the API
+    # is unreachable, which would stall the request (and its worker thread)
+    # instead of degrading to the fallback name after ~5s.
+    response = get_gemini_model().generate_content(
+        prompt, request_options={"timeout": 5, "retry": Retry(timeout=5)}
+    )
+    return response.text.strip().strip('"').strip("'")[:50]
+
+
+@router.post("/", responses={200: {"model": SessionWithTasksPublic}})
 def create_session(
     db: SessionDep,
     session_data: SessionCreate,
@@ -40,97 +349,133 @@ def create_session(
     # Generate a name if not provided
     session_name = session_data.name
     if not session_name:
-        # Generate a name based on the description and tasks
-        task_names = [task.name for task in session_data.tasks]
-        prompt = f"Generate a concise, descriptive name for a Pomodoro session with description: '{session_data.description}' and tasks: {', '.join(task_names)}. Keep it under 50 characters."
-        
-        try:
-            import google.generativeai as genai
-            from ..config import settings
-            
-            genai.configure(api_key=settings.gemini_api_key)
-            model = genai.GenerativeModel('gemini-pro')
-            response = model.generate_content(prompt)
-            session_name = response.text.strip().strip('"').strip("'")[:50]
-        except Exception as e:
-            print(f"Failed to generate session name: {e}")
-            # Fallback to a generic name
-            session_name = f"Session {len(session_data.tasks)} tasks"
+        description = (session_data.description or "").strip()
+        if len(description.split()) < 4 and len(session_data.tasks) <= 3:
+            # Trivial inputs don't warrant an LLM round-trip (hundreds of ms
+            # plus API cost); a deterministic local name is just as good.
+            session_name = f"{description or 'Focus'} ({len(session_data.tasks)} tasks)"[:50]
+        else:
+            # Generate a name based on the description and tasks
+            task_names = [task.name for task in session_data.tasks]
+            prompt = f"Generate a concise, descriptive name for a Pomodoro session with description: '{session_data.description}' and tasks: {', '.join(task_names)}. Keep it under 50 characters."
+
+            try:
+                session_name = _generated_session_name(prompt)
+            except Exception as e:
+                print(f"Failed to generate session name: {e}")
+                # Fallback to a generic name
+                session_name = f"Session {len(session_data.tasks)} tasks"
     
     # Create and persist the session first so it has an ID for FK references
+    config = session_data.pomodoro_config
     db_session = PomodoroSession(
         name=session_name,
         description=session_data.description,
         user_id=current_user.id,
-        **session_data.pomodoro_config.model_dump()
+        focus_duration=config.focus_duration,
+        short_break_duration=config.short_break_duration,
+        long_break_duration=config.long_break_duration,
+        long_break_per_pomodoros=config.long_break_per_pomodoros,
     )
     db.add(db_session)
-    db.commit()  # ensure db_session.id is populated
-    db.refresh(db_session)
+    db.flush()  # assigns db_session.id for the task FKs without committing yet
+
+    # Resolve all categories up front: one IN-query for existing rows plus a
+    # single flush for the missing ones, instead of a SELECT (and possibly a
+    # commit) per task.
+    category_names = {task_data.category for task_data in session_data.tasks}
+    categories_by_name = {
+        c.name: c
+        for c in db.exec(select(Category).where(Category.name.in_(category_names))).all()
+    }
+    missing_names = category_names - categories_by_name.keys()
+    if missing_names:
+        # Category.name is UNIQUE, so a concurrent request can insert the same
+        # name between our SELECT and the flush. There is no ON CONFLICT
+        # DO NOTHING that works on both SQLite and MySQL, so insert inside a
+        # savepoint and, on conflict, re-read the rows the other writer won.
+        missing = [Category(name=name) for name in missing_names]
+        try:
+            with db.begin_nested():
+                db.add_all(missing)
+        except IntegrityError:
+            categories_by_name.update({
+                c.name: c
+                for c in db.exec(
+                    select(Category).where(Category.name.in_(missing_names))
+                ).all()
+            })
+            leftovers = [
+                Category(name=name)
+                for name in missing_names - categories_by_name.keys()
+            ]
+            if leftovers:
+                db.add_all(leftovers)
+                db.flush()
+                categories_by_name.update({c.name: c for c in leftovers})
+        else:
+            categories_by_name.update({c.name: c for c in missing})
 
-    # Now create tasks with a proper session_id and sequential order
+    # Now create tasks with a proper session_id and sequential order, buffered
+    # into one add_all so the flush can batch them into a single executemany.
+    db_tasks = []
     for idx, task_data in enumerate(session_data.tasks):
-        category = db.exec(select(Category).where(Category.name == task_data.category)).first()
-        if not category:
-            category = Category(name=task_data.category)
-            db.add(category)
-            db.commit()
-            db.refresh(category)
-
         db_task = Task(
             name=task_data.name,
             estimated_completion_time=task_data.estimated_completion_time,
-            categories=[category],
+            primary_category_name=task_data.category,
             session_id=db_session.id,
             order=idx,
             due_date=task_data.due_date,
         )
-        db.add(db_task)
-        # Keep in-memory relationship collection in sync so tasks are present without a second refresh
-        if db_session.tasks is not None:
-            db_session.tasks.append(db_task)
-
-    if session_data.tasks:
-        db.commit()
-        # Refresh session to load tasks relationship (ensures ordering from DB)
-        db.refresh(db_session)
-
-    tasks_public = [
-        TaskPublic(
-            id=task.id,
-            name=task.name,
-            estimated_completion_time=task.estimated_completion_time,
-            category=task.categories[0].name if task.categories else "Uncategorized",
-            completed=task.completed,
-            actual_completion_time=task.actual_completion_time,
-            due_date=task.due_date,
-            archived=task.archived,
-            archived_at=task.archived_at,
+        db_tasks.append(db_task)
+    db.add_all(db_tasks)
+    if db_tasks:
+        # Flush assigns the task ids, then the category associations go in as
+        # one executemany instead of cascading through the relationship one
+        # link at a time.
+        db.flush()
+        db.execute(
+            insert(TaskCategoryLink),
+            [
+                {
+                    "task_id": task.id,
+                    "category_id": categories_by_name[task_data.category].id,
+                }
+                for task, task_data in zip(db_tasks, session_data.tasks)
+            ],
         )
-        for task in db_session.tasks
+    # Everything needed for the response is already in memory (the flush
+    # assigned the ids, the category names came from the request), so build
+    # the payload before the commit expires the instances and skip the
+    # post-commit reload entirely.
+    tasks_public = [
+        {
+            "id": task.id,
+            "name": task.name,
+            "estimated_completion_time": task.estimated_completion_time,
+            "category": task_data.category,
+            "completed": False,
+            "actual_completion_time": None,
+            "due_date": task.due_date,
+            "archived": False,
+            "archived_at": None,
+        }
+        for task, task_data in zip(db_tasks, session_data.tasks)
     ]
+    response = _session_with_tasks_payload(db_session, tasks_public)
+    db.commit()
 
-    return SessionWithTasksPublic(
-        id=db_session.id,
-        name=db_session.name,
-        description=db_session.description,
-        focus_duration=db_session.focus_duration,
-        short_break_duration=db_session.short_break_duration,
-        long_break_duration=db_session.long_break_duration,
-        long_break_per_pomodoros=db_session.long_break_per_pomodoros,
-        tasks=tasks_public,
-            completed=db_session.completed,
-            completed_at=db_session.completed_at,
-    archived=db_session.archived,
-    archived_at=db_session.archived_at,
-    )
+    return ORJSONResponse(content=response)
 
 
-@router.get("/", response_model=List[SessionWithTasksPublic])
+@router.get("/", responses={200: {"model": List[SessionWithTasksPublic]}})
 def read_sessions(
     db: SessionDep,
     current_user: ActiveUserDep,
     include_archived: bool = False,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = None,
 ):
     query = select(PomodoroSession).where(
         PomodoroSession.user_id == current_user.id,
@@ -138,58 +483,28 @@ def read_sessions(
     )
     if not include_archived:
         query = query.where(PomodoroSession.archived == False)  # noqa: E712
+    # Optional keyset pagination: pass the smallest id from the previous page
+    # as `cursor` to fetch the next `limit` sessions. Omitting both keeps the
+    # original return-everything behaviour for existing clients.
+    if cursor is not None:
+        query = query.where(PomodoroSession.id < cursor)
+    if cursor is not None or limit is not None:
+        query = query.order_by(PomodoroSession.id.desc()).limit(limit or 50)
+    # Eager-load tasks and their categories in two IN-queries instead of one
+    # task query per session plus one lazy category load per task. The
+    # relationship already orders tasks by Task.order.
+    query = query.options(selectinload(PomodoroSession.tasks))
     sessions = db.exec(query).all()
-    
+
     # Convert to SessionWithTasksPublic format to include tasks
     result = []
     for session in sessions:
-        # Get tasks for this session ordered by order field
-        tasks = db.exec(
-            select(Task)
-            .where(
-                Task.session_id == session.id,
-                Task.is_deleted == False  # noqa: E712
-            )
-            .order_by(Task.order)
-        ).all()
-        
-        # Convert tasks to TaskPublic format
-        task_publics = []
-        for task in tasks:
-            # Get category name
-            category_name = "Uncategorized"
-            if task.categories:
-                category_name = task.categories[0].name
-            
-            task_publics.append(TaskPublic(
-                id=task.id,
-                name=task.name,
-                estimated_completion_time=task.estimated_completion_time,
-                category=category_name,
-                completed=task.completed,
-                actual_completion_time=task.actual_completion_time,
-                due_date=task.due_date,
-                archived=task.archived,
-                archived_at=task.archived_at,
-            ))
-        
-        session_with_tasks = SessionWithTasksPublic(
-            id=session.id,
-            name=session.name,
-            description=session.description,
-            focus_duration=session.focus_duration,
-            short_break_duration=session.short_break_duration,
-            long_break_duration=session.long_break_duration,
-            long_break_per_pomodoros=session.long_break_per_pomodoros,
-            tasks=task_publics,
-                completed=session.completed,
-                completed_at=session.completed_at,
-            archived=session.archived,
-            archived_at=session.archived_at,
-        )
-        result.append(session_with_tasks)
-    
-    return result
+        task_publics = [
+            _task_payload(task) for task in session.tasks if not task.is_deleted
+        ]
+        result.append(_session_with_tasks_payload(session, task_publics))
+
+    return ORJSONResponse(content=result)
 
 
 @router.post("/{session_id}/archive", response_model=SessionPublic)
@@ -198,11 +513,11 @@ def archive_session(
     session_id: int,
     current_user: ActiveUserDep,
 ):
-    session = db.get(PomodoroSession, session_id)
-    if not session or session.user_id != current_user.id:
+    session = _owned_session(db, session_id, current_user.id)
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     if session.archived:
-        return SessionPublic(
+        return SessionPublic.model_construct(
             id=session.id,
             name=session.name,
             description=session.description,
@@ -215,20 +530,10 @@ def archive_session(
         )
     session.archived = True
     session.archived_at = datetime.utcnow()
-    db.add(session)
+    # Serialize before the commit expires the instance; no refresh needed
+    response = _session_public(session)
     db.commit()
-    db.refresh(session)
-    return SessionPublic(
-        id=session.id,
-        name=session.name,
-        description=session.description,
-        focus_duration=session.focus_duration,
-        short_break_duration=session.short_break_duration,
-        long_break_duration=session.long_break_duration,
-        long_break_per_pomodoros=session.long_break_per_pomodoros,
-        archived=session.archived,
-        archived_at=session.archived_at,
-    )
+    return response
 
 
 @router.post("/{session_id}/unarchive", response_model=SessionPublic)
@@ -237,61 +542,71 @@ def unarchive_session(
     session_id: int,
     current_user: ActiveUserDep,
 ):
-    session = db.get(PomodoroSession, session_id)
-    if not session or session.user_id != current_user.id:
+    session = _owned_session(db, session_id, current_user.id)
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     session.archived = False
     session.archived_at = None
-    db.add(session)
+    response = _session_public(session)
     db.commit()
-    db.refresh(session)
-    return SessionPublic(
-        id=session.id,
-        name=session.name,
-        description=session.description,
-        focus_duration=session.focus_duration,
-        short_break_duration=session.short_break_duration,
-        long_break_duration=session.long_break_duration,
-        long_break_per_pomodoros=session.long_break_per_pomodoros,
-        archived=session.archived,
-        archived_at=session.archived_at,
-    )
+    return response
 
 
-@router.post("/active", response_model=ActiveSessionPublic)
+@router.post("/active", responses={200: {"model": ActiveSessionPublic}})
 def start_active_session(
     db: SessionDep,
     session_data: ActiveSessionCreate,
     current_user: ActiveUserDep,
 ):
-    # Get the session to validate it belongs to the user
-    db_session = db.get(PomodoroSession, session_data.session_id)
-    if (
-        not db_session
-        or db_session.user_id != current_user.id
-        or db_session.is_deleted
-    ):
+    # Only four values of the session are needed here; project them (plus the
+    # first task id via a scalar subquery) instead of hydrating the full ORM
+    # row and its task collection.
+    first_task_sq = (
+        select(Task.id)
+        .where(
+            Task.session_id == session_data.session_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .order_by(Task.order)
+        .limit(1)
+        .scalar_subquery()
+    )
+    row = db.exec(
+        select(
+            PomodoroSession.name,
+            PomodoroSession.focus_duration,
+            PomodoroSession.completed,
+            first_task_sq,
+        ).where(
+            PomodoroSession.id == session_data.session_id,
+            PomodoroSession.user_id == current_user.id,
+            PomodoroSession.is_deleted == False,  # noqa: E712
+        )
+    ).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Session not found")
-    
+    session_name, focus_duration, session_completed, first_task_id = row
+
     # Prevent starting completed sessions
-    if db_session.completed:
+    if session_completed:
         raise HTTPException(status_code=400, detail="Cannot start a completed session")
 
     # Check if there's already an active session
-    existing_active = db.exec(
-        select(ActivePomodoroSession).where(ActivePomodoroSession.user_id == current_user.id)
-    ).first()
-    
+    existing_active = _active_session_for_user(db, current_user.id)
+
+    # One clock read so the switch and start events carry the same instant
+    now_iso = datetime.utcnow().isoformat()
+
     if existing_active:
         # Log session switch analytics event
-        AnalyticsService.log_event(
+        AnalyticsService.queue_event(
             db=db,
             user_id=current_user.id,
             event_type="session_switch",
             event_data={
                 "from_session_id": existing_active.session_id,
                 "to_session_id": session_data.session_id,
-                "switch_time": datetime.utcnow().isoformat()
+                "switch_time": now_iso
             }
         )
         
@@ -301,26 +616,50 @@ def start_active_session(
         # Update existing active session
         existing_active.session_id = session_data.session_id
         existing_active.is_running = False
-        existing_active.time_remaining = db_session.focus_duration * 60
+        existing_active.time_remaining = focus_duration * 60
         existing_active.phase = "focus"
         existing_active.pomodoros_completed = 0
         # Set first non-deleted task as current if available
-        first_task = next((t for t in db_session.tasks if not t.is_deleted), None)
-        existing_active.current_task_id = first_task.id if first_task else None
-        db.add(existing_active)
+        existing_active.current_task_id = first_task_id
+        # existing_active is already tracked by the session; no add needed
+        active_session = existing_active
     else:
-        # Create new active session
+        # Create new active session. user_id is unique-indexed, so two
+        # concurrent starts cannot both insert; without a portable
+        # ON CONFLICT upsert across SQLite and MySQL, insert inside a
+        # savepoint and fall back to resetting the row the other request won.
         active_session = ActivePomodoroSession(
             user_id=current_user.id,
             session_id=session_data.session_id,
             is_running=False,
-            time_remaining=db_session.focus_duration * 60,
+            time_remaining=focus_duration * 60,
             phase="focus",
             pomodoros_completed=0,
-            current_task_id=(next((t.id for t in db_session.tasks if not t.is_deleted), None)),
+            current_task_id=first_task_id,
         )
-        db.add(active_session)
-    
+        try:
+            with db.begin_nested():
+                db.add(active_session)
+        except IntegrityError:
+            active_session = _active_session_for_user(db, current_user.id)
+            if active_session is None:
+                raise HTTPException(
+                    status_code=409, detail="Could not start active session"
+                )
+            active_session.session_id = session_data.session_id
+            active_session.is_running = False
+            active_session.time_remaining = focus_duration * 60
+            active_session.phase = "focus"
+            active_session.pomodoros_completed = 0
+            active_session.current_task_id = first_task_id
+
+    # Flush now so a freshly inserted row gets its id, then capture the
+    # response payload while the instance is still live — this avoids the
+    # post-commit refresh SELECT that used to run just to rebuild values we
+    # already set ourselves.
+    db.flush()
+    payload = _active_session_payload(active_session)
+
     # Start analytics tracking for new session
     AnalyticsService.start_session_analytics(
         db=db,
@@ -329,63 +668,50 @@ def start_active_session(
     )
     
     # Log session start event
-    AnalyticsService.log_event(
+    AnalyticsService.queue_event(
         db=db,
         user_id=current_user.id,
         event_type="session_start",
         event_data={
             "session_id": session_data.session_id,
-            "session_name": db_session.name,
-            "start_time": datetime.utcnow().isoformat()
+            "session_name": session_name,
+            "start_time": now_iso
         }
     )
     
     db.commit()
-    db.refresh(existing_active if existing_active else active_session)
-    
-    return ActiveSessionPublic(
-        id=(existing_active if existing_active else active_session).id,
-        session_id=session_data.session_id,
-        current_task_id=(existing_active if existing_active else active_session).current_task_id,
-        is_running=False,
-        time_remaining=(existing_active if existing_active else active_session).time_remaining,
-        phase="focus",
-        pomodoros_completed=0,
-    )
+    _invalidate_active_cache(current_user.id)
+
+    return ORJSONResponse(content=payload)
 
 
-@router.get("/active", response_model=ActiveSessionPublic)
+@router.get("/active", responses={200: {"model": ActiveSessionPublic}})
 def get_active_session(
     db: SessionDep,
     current_user: ActiveUserDep,
 ):
-    active_session = db.exec(
-        select(ActivePomodoroSession).where(ActivePomodoroSession.user_id == current_user.id)
-    ).first()
-    
+    cached = _get_cached_active_payload(current_user.id)
+    if cached is not None:
+        return ORJSONResponse(content=cached)
+
+    active_session = _active_session_for_user(db, current_user.id)
+
     if not active_session:
         raise HTTPException(status_code=404, detail="No active session found")
-    
-    return ActiveSessionPublic(
-        id=active_session.id,
-        session_id=active_session.session_id,
-        current_task_id=active_session.current_task_id,
-        is_running=active_session.is_running,
-        time_remaining=active_session.time_remaining,
-        phase=active_session.phase,
-        pomodoros_completed=active_session.pomodoros_completed,
-    )
 
+    payload = _active_session_payload(active_session)
+    _store_active_payload(current_user.id, payload)
+    return ORJSONResponse(content=payload)
 
-@router.put("/active", response_model=ActiveSessionPublic)
+
+@router.put("/active", responses={200: {"model": ActiveSessionPublic}})
 def update_active_session(
     db: SessionDep,
     session_update: ActiveSessionUpdate,
     current_user: ActiveUserDep,
+    background_tasks: BackgroundTasks,
 ):
-    active_session = db.exec(
-        select(ActivePomodoroSession).where(ActivePomodoroSession.user_id == current_user.id)
-    ).first()
+    active_session = _active_session_for_user(db, current_user.id)
     
     if not active_session:
         raise HTTPException(status_code=404, detail="No active session found")
@@ -393,16 +719,25 @@ def update_active_session(
     # Track previous state for analytics
     previous_running = active_session.is_running
     previous_phase = active_session.phase
-    
+
+    # One clock read per request; every timestamp below refers to the same
+    # instant, and repeated utcnow()/isoformat() calls on this hot path add up.
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
+
+    # Diff the payload once instead of re-checking each optional attribute;
+    # only fields the client actually sent appear in the dict.
+    updates = session_update.model_dump(exclude_unset=True, exclude_none=True)
+
     # Update fields if provided
-    if session_update.is_running is not None:
-        active_session.is_running = session_update.is_running
-        if session_update.is_running:
-            active_session.start_time = datetime.utcnow()
+    if "is_running" in updates:
+        active_session.is_running = updates["is_running"]
+        if updates["is_running"]:
+            active_session.start_time = now
             active_session.pause_time = None
             
             # Log timer start event
-            AnalyticsService.log_event(
+            AnalyticsService.queue_event(
                 db=db,
                 user_id=current_user.id,
                 event_type="timer_start",
@@ -413,10 +748,10 @@ def update_active_session(
                 }
             )
         else:
-            active_session.pause_time = datetime.utcnow()
+            active_session.pause_time = now
             
             # Log timer pause event
-            AnalyticsService.log_event(
+            AnalyticsService.queue_event(
                 db=db,
                 user_id=current_user.id,
                 event_type="timer_pause",
@@ -429,139 +764,142 @@ def update_active_session(
             
             # Update interruptions count if pausing during focus
             if active_session.phase == "focus":
-                AnalyticsService.update_session_analytics(
-                    db=db,
+                background_tasks.add_task(
+                    AnalyticsService.update_session_analytics_background,
                     session_id=active_session.session_id,
-                    inc__interruptions_count=1
+                    inc__interruptions_count=1,
                 )
 
-    if session_update.time_remaining is not None:
-        active_session.time_remaining = session_update.time_remaining
+    if "time_remaining" in updates:
+        active_session.time_remaining = updates["time_remaining"]
 
-    if session_update.phase is not None:
+    if "phase" in updates:
+        new_phase = updates["phase"]
         # Log phase change
-        if previous_phase != session_update.phase:
-            AnalyticsService.log_event(
+        if previous_phase != new_phase:
+            AnalyticsService.queue_event(
                 db=db,
                 user_id=current_user.id,
                 event_type="phase_change",
                 event_data={
                     "session_id": active_session.session_id,
                     "from_phase": previous_phase,
-                    "to_phase": session_update.phase,
-                    "change_time": datetime.utcnow().isoformat()
+                    "to_phase": new_phase,
+                    "change_time": now_iso
                 }
             )
             
             # If switching to break, log break start
-            if session_update.phase in ["short_break", "long_break"]:
-                AnalyticsService.log_event(
+            if new_phase in ["short_break", "long_break"]:
+                AnalyticsService.queue_event(
                     db=db,
                     user_id=current_user.id,
                     event_type="break_start",
                     event_data={
                         "session_id": active_session.session_id,
-                        "break_type": session_update.phase,
-                        "start_time": datetime.utcnow().isoformat()
+                        "break_type": new_phase,
+                        "start_time": now_iso
                     }
                 )
         
         # Apply phase change only when provided
-        active_session.phase = session_update.phase
+        active_session.phase = new_phase
 
     # Avoid attributing break time automatically; skip-time vs completion isn't distinguishable here
 
-    if session_update.current_task_id is not None:
+    if "current_task_id" in updates:
+        new_task_id = updates["current_task_id"]
         # Log task switch if different
-        if active_session.current_task_id != session_update.current_task_id:
-            AnalyticsService.log_event(
+        if active_session.current_task_id != new_task_id:
+            AnalyticsService.queue_event(
                 db=db,
                 user_id=current_user.id,
                 event_type="task_switch",
                 event_data={
                     "session_id": active_session.session_id,
                     "from_task_id": active_session.current_task_id,
-                    "to_task_id": session_update.current_task_id,
-                    "switch_time": datetime.utcnow().isoformat()
+                    "to_task_id": new_task_id,
+                    "switch_time": now_iso
                 }
             )
         
-        active_session.current_task_id = session_update.current_task_id
+        active_session.current_task_id = new_task_id
 
     # Handle pomodoro count updates independently of task switching
-    if session_update.pomodoros_completed is not None:
+    if "pomodoros_completed" in updates:
+        new_count = updates["pomodoros_completed"]
         # Log pomodoro completion if increased
-        if session_update.pomodoros_completed > active_session.pomodoros_completed:
-            delta = session_update.pomodoros_completed - active_session.pomodoros_completed
-            AnalyticsService.log_event(
+        if new_count > active_session.pomodoros_completed:
+            delta = new_count - active_session.pomodoros_completed
+            AnalyticsService.queue_event(
                 db=db,
                 user_id=current_user.id,
                 event_type="pomodoro_complete",
                 event_data={
                     "session_id": active_session.session_id,
-                    "pomodoros_completed": session_update.pomodoros_completed,
-                    "completion_time": datetime.utcnow().isoformat()
+                    "pomodoros_completed": new_count,
+                    "completion_time": now_iso
                 }
             )
 
-            # Update session analytics with delta increments
-            AnalyticsService.update_session_analytics(
-                db=db,
+            # One analytics update carrying both increments; a scalar select
+            # fetches just focus_duration instead of hydrating the whole
+            # session via db.get.
+            focus_duration = db.exec(
+                select(PomodoroSession.focus_duration).where(
+                    PomodoroSession.id == active_session.session_id
+                )
+            ).one_or_none()
+            increments = {"inc__pomodoros_completed": delta}
+            if focus_duration:
+                increments["inc__total_focus_time"] = delta * focus_duration * 60
+            background_tasks.add_task(
+                AnalyticsService.update_session_analytics_background,
                 session_id=active_session.session_id,
-                inc__pomodoros_completed=delta
+                **increments,
             )
 
-            # Increment total focus time by one full focus duration for each pomodoro completion
-            session = db.get(PomodoroSession, active_session.session_id)
-            if session and session.focus_duration:
-                AnalyticsService.update_session_analytics(
-                    db=db,
-                    session_id=active_session.session_id,
-                    inc__total_focus_time=delta * session.focus_duration * 60
-                )
-
-        active_session.pomodoros_completed = session_update.pomodoros_completed
+        active_session.pomodoros_completed = new_count
 
     # Ensure required fields are non-null before persisting
     if not active_session.phase:
         active_session.phase = "focus"
-    db.add(active_session)
+    # Build the response before committing: the values are already known in
+    # memory, so the post-commit refresh SELECT is pure overhead.
+    db.flush()
+    payload = _active_session_payload(active_session)
     db.commit()
-    db.refresh(active_session)
-
-    return ActiveSessionPublic(
-        id=active_session.id,
-        session_id=active_session.session_id,
-        current_task_id=active_session.current_task_id,
-        is_running=active_session.is_running,
-        time_remaining=active_session.time_remaining,
-        phase=active_session.phase,
-        pomodoros_completed=active_session.pomodoros_completed,
-    )
+    _invalidate_active_cache(current_user.id)
 
+    return ORJSONResponse(content=payload)
 
-@router.delete("/active", response_model=dict)
+
+@router.delete("/active")
 def stop_active_session(
     db: SessionDep,
     current_user: ActiveUserDep,
 ):
-    active_session = db.exec(
-        select(ActivePomodoroSession).where(ActivePomodoroSession.user_id == current_user.id)
-    ).first()
-    
-    if not active_session:
+    # Delete directly by user_id; the rowcount doubles as the existence
+    # check, replacing the previous SELECT + ORM delete pair.
+    result = db.execute(
+        delete(ActivePomodoroSession).where(
+            ActivePomodoroSession.user_id == current_user.id
+        )
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="No active session found")
-    
-    db.delete(active_session)
+
     db.commit()
-    
+    _invalidate_active_cache(current_user.id)
+
     return {"message": "Active session stopped successfully"}
 
 
-@router.get("/daily-progress", response_model=dict)
+@router.get("/daily-progress")
 def get_daily_progress(
     current_user: ActiveUserDep,
-    db: SessionDep
+    db: SessionDep,
+    request: Request = None,
 ):
     """Get daily progress for the current user."""
     from datetime import date, datetime, time
@@ -570,9 +908,37 @@ def get_daily_progress(
     today = date.today()
     today_start = datetime.combine(today, time.min)
     today_end = datetime.combine(today, time.max)
+
+    # Fresh cache entry: skip even the version-stamp queries. Completion
+    # writes call _invalidate_progress_cache, so within the TTL the cached
+    # answer is current.
+    cached = _get_cached_progress(current_user.id, today.isoformat())
+    if cached is not None:
+        etag, payload = cached
+        if request is not None and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        return ORJSONResponse(content=payload, headers={"ETag": etag})
+
+    # The result only changes when a task completion changes, so a cheap
+    # version stamp (count + latest completion) lets no-op polls return 304
+    # without running the aggregates below.
+    user_session_ids = select(PomodoroSession.id).where(
+        PomodoroSession.user_id == current_user.id,
+        PomodoroSession.is_deleted == False  # noqa: E712
+    )
+    stamp = db.exec(
+        select(func.count(), func.max(Task.completed_at)).where(
+            Task.completed == True,  # noqa: E712
+            Task.is_deleted == False,  # noqa: E712
+            Task.session_id.in_(user_session_ids),
+        )
+    ).one()
+    etag = f'"{today.isoformat()}-{stamp[0]}-{stamp[1]}"'
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
     
     # 1. Count completed tasks today
-    completed_tasks_query = select(Task).where(
+    completed_tasks_query = select(func.count()).select_from(Task).where(
         Task.completed == True,
         Task.completed_at >= today_start,
         Task.completed_at <= today_end,
@@ -586,47 +952,25 @@ def get_daily_progress(
     )
     completed_tasks_query = completed_tasks_query.where(Task.session_id.in_(user_sessions))
     
-    completed_tasks_result = db.exec(completed_tasks_query)
-    completed_tasks = len(list(completed_tasks_result))
+    completed_tasks = db.exec(completed_tasks_query).one()
     
     # 2. Count completed sessions today
     # A session is considered completed if all its tasks are completed
-    # and the last task was completed today
-    completed_sessions = 0
-    
-    # Get all user's sessions
-    user_sessions_query = select(PomodoroSession).where(
-        PomodoroSession.user_id == current_user.id,
-        PomodoroSession.is_deleted == False  # noqa: E712
-    )
-    user_sessions_result = db.exec(user_sessions_query)
-    
-    for session in user_sessions_result:
-        # Get all tasks for this session
-        session_tasks_query = select(Task).where(
-            Task.session_id == session.id,
+    # and the last task was completed today. One GROUP BY over the user's
+    # tasks replaces the old per-session query + Python scan.
+    done_count = func.sum(case((Task.completed == True, 1), else_=0))  # noqa: E712
+    completed_session_rows = db.exec(
+        select(Task.session_id)
+        .where(
+            Task.session_id.in_(user_sessions),
             Task.is_deleted == False  # noqa: E712
         )
-        session_tasks = list(db.exec(session_tasks_query))
-        
-        if not session_tasks:
-            continue
-            
-        # Check if all tasks are completed
-        all_completed = all(task.completed for task in session_tasks)
-        
-        if all_completed:
-            # Check if the last completed task was today
-            completed_tasks_today = [
-                task for task in session_tasks 
-                if task.completed_at and today_start <= task.completed_at <= today_end
-            ]
-            
-            if completed_tasks_today:
-                # Find the most recent completion time
-                latest_completion = max(task.completed_at for task in completed_tasks_today)
-                if today_start <= latest_completion <= today_end:
-                    completed_sessions += 1
+        .group_by(Task.session_id)
+        .having(func.count() == done_count)
+        .having(func.max(Task.completed_at) >= today_start)
+        .having(func.max(Task.completed_at) <= today_end)
+    ).all()
+    completed_sessions = len(completed_session_rows)
     
     # 3. Calculate rest time (estimate based on completed pomodoros)
     # For each completed task, assume some break time
@@ -638,71 +982,33 @@ def get_daily_progress(
     
     # 5. Today's date
     date_str = today.isoformat()
-    
-    return {
+
+    payload = {
         "rest_time_minutes": rest_time_minutes,
         "daily_goal_sessions": daily_goal_sessions,
         "completed_tasks": completed_tasks,
         "completed_sessions": completed_sessions,
         "date": date_str
     }
+    _store_progress(current_user.id, date_str, etag, payload)
+
+    return ORJSONResponse(content=payload, headers={"ETag": etag})
 
 
-@router.get("/{session_id}", response_model=SessionWithTasksPublic)
+@router.get("/{session_id}", responses={200: {"model": SessionWithTasksPublic}})
 def read_session(
     db: SessionDep,
     session_id: int,
     current_user: ActiveUserDep,
     include_archived: bool = False,
 ):
-    db_session = db.get(PomodoroSession, session_id)
-    if (
-        not db_session
-        or db_session.user_id != current_user.id
-        or db_session.is_deleted
-    ):
+    db_session = _owned_session(db, session_id, current_user.id)
+    if not db_session or db_session.is_deleted:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Get tasks ordered by the order field
-    ordered_tasks = db.exec(
-        select(Task)
-        .where(
-            Task.session_id == session_id,
-            Task.is_deleted == False  # noqa: E712
-        )
-        .order_by(Task.order)
-    ).all()
-    
-    visible_tasks = [t for t in ordered_tasks if include_archived or not t.archived]
-    tasks_public = [
-        TaskPublic(
-            id=task.id,
-            name=task.name,
-            estimated_completion_time=task.estimated_completion_time,
-            category=task.categories[0].name if task.categories else "Uncategorized",
-            completed=task.completed,
-            actual_completion_time=task.actual_completion_time,
-            due_date=task.due_date,
-            archived=task.archived,
-            archived_at=task.archived_at,
-        )
-        for task in visible_tasks
-    ]
+    tasks_public = _task_rows_payload(db, session_id, include_archived)
 
-    return SessionWithTasksPublic(
-        id=db_session.id,
-        name=db_session.name,
-        description=db_session.description,
-        focus_duration=db_session.focus_duration,
-        short_break_duration=db_session.short_break_duration,
-        long_break_duration=db_session.long_break_duration,
-        long_break_per_pomodoros=db_session.long_break_per_pomodoros,
-        tasks=tasks_public,
-            completed=db_session.completed,
-            completed_at=db_session.completed_at,
-    archived=db_session.archived,
-    archived_at=db_session.archived_at,
-    )
+    return ORJSONResponse(content=_session_with_tasks_payload(db_session, tasks_public))
 
 
 @router.put("/{session_id}", response_model=SessionPublic)
@@ -712,22 +1018,24 @@ def update_session(
     session_update: SessionUpdate,
     current_user: ActiveUserDep,
 ):
-    db_session = db.get(PomodoroSession, session_id)
-    if (
-        not db_session
-        or db_session.user_id != current_user.id
-        or db_session.is_deleted
-    ):
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    # Check if there's an active session running for this session
-    active_session = db.exec(
-        select(ActivePomodoroSession).where(
-            ActivePomodoroSession.session_id == session_id,
-            ActivePomodoroSession.user_id == current_user.id
+    # Fetch the session and any active session pointing at it in one
+    # outer-joined query instead of two separate lookups.
+    row = db.exec(
+        select(PomodoroSession, ActivePomodoroSession)
+        .outerjoin(
+            ActivePomodoroSession,
+            (ActivePomodoroSession.session_id == PomodoroSession.id)
+            & (ActivePomodoroSession.user_id == current_user.id),
+        )
+        .where(
+            PomodoroSession.id == session_id,
+            PomodoroSession.user_id == current_user.id,
         )
     ).first()
-    
+    if not row or row[0].is_deleted:
+        raise HTTPException(status_code=404, detail="Session not found")
+    db_session, active_session = row
+
     if active_session and active_session.is_running:
         raise HTTPException(
             status_code=400, 
@@ -748,10 +1056,6 @@ def update_session(
     if session_update.long_break_per_pomodoros is not None:
         db_session.long_break_per_pomodoros = session_update.long_break_per_pomodoros
     
-    db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
-    
     # Update active session timing if one exists and timing values were changed
     timing_changed = any([
         session_update.focus_duration is not None,
@@ -760,6 +1064,7 @@ def update_session(
         session_update.long_break_per_pomodoros is not None
     ])
     
+    active_timing_updated = False
     if timing_changed and active_session and not active_session.is_running:
         # Update the time_remaining based on current phase and new timings
         if active_session.phase == "focus":
@@ -768,63 +1073,57 @@ def update_session(
             active_session.time_remaining = db_session.short_break_duration * 60
         elif active_session.phase == "long_break":
             active_session.time_remaining = db_session.long_break_duration * 60
-        
-        db.add(active_session)
-        db.commit()
-        db.refresh(active_session)
-    
-    # Return in SessionPublic format to ensure consistency
-    return SessionPublic(
-        id=db_session.id,
-        name=db_session.name,
-        description=db_session.description,
-        focus_duration=db_session.focus_duration,
-        short_break_duration=db_session.short_break_duration,
-        long_break_duration=db_session.long_break_duration,
-        long_break_per_pomodoros=db_session.long_break_per_pomodoros,
-        archived=db_session.archived,
-        archived_at=db_session.archived_at,
-    )
+        active_timing_updated = True
+
+    # Serialize before the single commit below; the values are already in
+    # memory, so the old commit-refresh-commit dance was two extra roundtrips.
+    response = _session_public(db_session)
+    db.commit()
+    if active_timing_updated:
+        _invalidate_active_cache(current_user.id)
+
+    return response
 
 
-@router.delete("/{session_id}", response_model=dict)
+@router.delete("/{session_id}")
 def delete_session(
     db: SessionDep,
     session_id: int,
     current_user: ActiveUserDep,
 ):
-    db_session = db.get(PomodoroSession, session_id)
-    if (
-        not db_session
-        or db_session.user_id != current_user.id
-    ):
+    db_session = _owned_session(db, session_id, current_user.id)
+    if not db_session:
         raise HTTPException(status_code=404, detail="Session not found")
     # Soft delete session and its tasks
     if not db_session.is_deleted:
+        # Single clock read: the session and every task share one deletion
+        # timestamp instead of drifting across loop iterations.
+        now = datetime.utcnow()
         db_session.is_deleted = True
-        db_session.deleted_at = datetime.utcnow()
-        # Soft delete tasks
-        for task in db_session.tasks:
-            if not task.is_deleted:
-                task.is_deleted = True
-                task.deleted_at = datetime.utcnow()
-                db.add(task)
-        # Remove active session if pointing to this
-        active = db.exec(
-            select(ActivePomodoroSession).where(
+        db_session.deleted_at = now
+        # Soft delete tasks with one bulk UPDATE instead of loading the task
+        # collection and flipping rows one at a time.
+        db.execute(
+            update(Task)
+            .where(Task.session_id == session_id, Task.is_deleted == False)  # noqa: E712
+            .values(is_deleted=True, deleted_at=now)
+        )
+        # Remove active session if pointing to this; the rowcount replaces
+        # the previous SELECT-then-delete pair.
+        db.execute(
+            delete(ActivePomodoroSession).where(
                 ActivePomodoroSession.user_id == current_user.id,
                 ActivePomodoroSession.session_id == session_id,
             )
-        ).first()
-        if active:
-            db.delete(active)
-        db.add(db_session)
+        )
         db.commit()
+        _invalidate_active_cache(current_user.id)
+        _invalidate_progress_cache(current_user.id)
     return {"message": "Session deleted (soft) successfully"}
 
 
 # Task management endpoints
-@router.post("/{session_id}/tasks", response_model=TaskPublic)
+@router.post("/{session_id}/tasks", responses={200: {"model": TaskPublic}})
 def add_task_to_session(
     db: SessionDep,
     session_id: int,
@@ -832,17 +1131,11 @@ def add_task_to_session(
     current_user: ActiveUserDep,
 ):
     # Verify session exists and belongs to user
-    db_session = db.get(PomodoroSession, session_id)
-    if not db_session or db_session.user_id != current_user.id:
+    if not _owns_session(db, session_id, current_user.id):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Get or create category
-    category = db.exec(select(Category).where(Category.name == task_data.category)).first()
-    if not category:
-        category = Category(name=task_data.category)
-        db.add(category)
-        db.commit()
-        db.refresh(category)
+    # Resolve the category id (cached for repeat names)
+    category_id = _category_id_for_name(db, task_data.category)
     
     # Get the highest order value for tasks in this session
     max_order_result = db.exec(
@@ -857,42 +1150,34 @@ def add_task_to_session(
     db_task = Task(
         name=task_data.name,
         estimated_completion_time=task_data.estimated_completion_time,
+        primary_category_name=task_data.category,
         session_id=session_id,
         completed=False,
         order=next_order,
         due_date=task_data.due_date,
     )
-    # Add the category to the task through the many-to-many relationship
-    db_task.categories = [category]
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
-    
-    return TaskPublic(
-        id=db_task.id,
-        name=db_task.name,
-        estimated_completion_time=db_task.estimated_completion_time,
-        category=category.name,
-        completed=db_task.completed,
-        actual_completion_time=db_task.actual_completion_time,
-        due_date=db_task.due_date,
+    # One flush assigns the task id; the association row is written directly
+    # against the cached category id so no Category instance is loaded.
+    db.flush()
+    db.execute(
+        insert(TaskCategoryLink).values(task_id=db_task.id, category_id=category_id)
     )
+    response = _task_payload(db_task)
+    db.commit()
 
+    return response
 
-@router.put("/tasks/{task_id}", response_model=TaskPublic)
+
+@router.put("/tasks/{task_id}", responses={200: {"model": TaskPublic}})
 def update_task(
     db: SessionDep,
     task_id: int,
     task_data: TaskUpdate,
     current_user: ActiveUserDep,
 ):
-    task = db.get(Task, task_id)
-    if not task or task.is_deleted:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Verify the task belongs to a session owned by the user
-    session = db.get(PomodoroSession, task.session_id)
-    if not session or session.user_id != current_user.id:
+    task = _get_user_task(db, task_id, current_user.id)
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     # Update task fields
@@ -905,30 +1190,18 @@ def update_task(
     
     # Update category if provided
     if task_data.category is not None:
-        category = db.exec(select(Category).where(Category.name == task_data.category)).first()
-        if not category:
-            category = Category(name=task_data.category)
-            db.add(category)
-            db.commit()
-            db.refresh(category)
-        task.categories = [category]
-    
+        category_id = _category_id_for_name(db, task_data.category)
+        db.execute(delete(TaskCategoryLink).where(TaskCategoryLink.task_id == task.id))
+        db.execute(
+            insert(TaskCategoryLink).values(task_id=task.id, category_id=category_id)
+        )
+        task.primary_category_name = task_data.category
+
     db.add(task)
+    response = _task_payload(task)
     db.commit()
-    db.refresh(task)
-    
-    # Get category name for response
-    category_name = task.categories[0].name if task.categories else "Uncategorized"
-    
-    return TaskPublic(
-        id=task.id,
-        name=task.name,
-        estimated_completion_time=task.estimated_completion_time,
-        category=category_name,
-        completed=task.completed,
-        actual_completion_time=task.actual_completion_time,
-        due_date=task.due_date,
-    )
+
+    return response
 
 
 @router.delete("/tasks/{task_id}")
@@ -937,13 +1210,8 @@ def delete_task(
     task_id: int,
     current_user: ActiveUserDep,
 ):
-    task = db.get(Task, task_id)
-    if not task or task.is_deleted:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Verify the task belongs to a session owned by the user
-    session = db.get(PomodoroSession, task.session_id)
-    if not session or session.user_id != current_user.id:
+    task = _get_user_task(db, task_id, current_user.id)
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     # Soft delete task
@@ -951,12 +1219,11 @@ def delete_task(
     task.deleted_at = datetime.utcnow()
     db.add(task)
     # If active session points to this task, unset it
-    parent_session = db.get(PomodoroSession, task.session_id) if task.session_id else None
-    if parent_session:
+    if task.session_id:
         active = db.exec(
             select(ActivePomodoroSession).where(
-                ActivePomodoroSession.user_id == parent_session.user_id,
-                ActivePomodoroSession.session_id == parent_session.id,
+                ActivePomodoroSession.user_id == current_user.id,
+                ActivePomodoroSession.session_id == task.session_id,
                 ActivePomodoroSession.current_task_id == task_id,
             )
         ).first()
@@ -964,61 +1231,45 @@ def delete_task(
             active.current_task_id = None
             db.add(active)
     db.commit()
+    _invalidate_active_cache(current_user.id)
+    _invalidate_progress_cache(current_user.id)
     return {"message": "Task deleted (soft) successfully"}
 
 
-@router.post("/tasks/{task_id}/archive", response_model=TaskPublic)
+@router.post("/tasks/{task_id}/archive", responses={200: {"model": TaskPublic}})
 def archive_task(
     db: SessionDep,
     task_id: int,
     current_user: ActiveUserDep,
 ):
-    task = db.get(Task, task_id)
-    if not task or (task.session and task.session.user_id != current_user.id):
+    task = _get_user_task(db, task_id, current_user.id)
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     task.archived = True
     task.archived_at = datetime.utcnow()
     db.add(task)
+    response = _task_payload(task)
     db.commit()
-    db.refresh(task)
-    return TaskPublic(
-        id=task.id,
-        name=task.name,
-        estimated_completion_time=task.estimated_completion_time,
-        category=task.categories[0].name if task.categories else "Uncategorized",
-        completed=task.completed,
-        actual_completion_time=task.actual_completion_time,
-        due_date=task.due_date,
-        archived=task.archived,
-        archived_at=task.archived_at,
-    )
 
+    return response
 
-@router.post("/tasks/{task_id}/unarchive", response_model=TaskPublic)
+
+@router.post("/tasks/{task_id}/unarchive", responses={200: {"model": TaskPublic}})
 def unarchive_task(
     db: SessionDep,
     task_id: int,
     current_user: ActiveUserDep,
 ):
-    task = db.get(Task, task_id)
-    if not task or (task.session and task.session.user_id != current_user.id):
+    task = _get_user_task(db, task_id, current_user.id)
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     task.archived = False
     task.archived_at = None
     db.add(task)
+    response = _task_payload(task)
     db.commit()
-    db.refresh(task)
-    return TaskPublic(
-        id=task.id,
-        name=task.name,
-        estimated_completion_time=task.estimated_completion_time,
-        category=task.categories[0].name if task.categories else "Uncategorized",
-        completed=task.completed,
-        actual_completion_time=task.actual_completion_time,
-        due_date=task.due_date,
-        archived=task.archived,
-        archived_at=task.archived_at,
-    )
+
+    return response
 
 
 @router.put("/{session_id}/tasks/reorder")
@@ -1029,59 +1280,83 @@ def reorder_tasks(
     current_user: ActiveUserDep,
 ):
     # Verify session exists and belongs to user
-    db_session = db.get(PomodoroSession, session_id)
-    if not db_session or db_session.user_id != current_user.id:
+    if not _owns_session(db, session_id, current_user.id):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Get all tasks for this session
-    tasks = db.exec(
-        select(Task).where(
-            Task.session_id == session_id,
-            Task.is_deleted == False  # noqa: E712
-        )
-    ).all()
-    task_dict = {task.id: task for task in tasks}
-    
-    # Verify all task IDs belong to this session
+    # Validate against the id set only; no Task hydration needed
+    existing_ids = set(
+        db.exec(
+            select(Task.id).where(
+                Task.session_id == session_id,
+                Task.is_deleted == False  # noqa: E712
+            )
+        ).all()
+    )
+    requested_ids = set(reorder_data.task_ids)
     for task_id in reorder_data.task_ids:
-        if task_id not in task_dict:
+        if task_id not in existing_ids:
             raise HTTPException(status_code=400, detail=f"Task {task_id} not found in session")
     
     # Verify all session tasks are included in the reorder
-    if len(reorder_data.task_ids) != len(tasks):
+    if requested_ids != existing_ids or len(reorder_data.task_ids) != len(existing_ids):
         raise HTTPException(status_code=400, detail="All tasks must be included in reorder")
     
-    # Update the order field for each task
-    for index, task_id in enumerate(reorder_data.task_ids):
-        task = task_dict[task_id]
-        task.order = index
-        db.add(task)
-    
+    # Nothing to update for a task-less session; an empty CASE is invalid SQL
+    if not reorder_data.task_ids:
+        return {"message": "Tasks reordered successfully"}
+
+    # One bulk UPDATE with a CASE over the ids replaces the per-task flush
+    order_case = case(
+        {task_id: index for index, task_id in enumerate(reorder_data.task_ids)},
+        value=Task.id,
+    )
+    db.execute(
+        update(Task)
+        .where(Task.id.in_(reorder_data.task_ids))
+        .values(order=order_case)
+    )
     db.commit()
     
     return {"message": "Tasks reordered successfully"}
 
 
-@router.put("/tasks/{task_id}/complete", response_model=dict)
+@router.put("/tasks/{task_id}/complete")
 def complete_task(
     db: SessionDep,
     task_id: int,
     current_user: ActiveUserDep,
+    background_tasks: BackgroundTasks,
     task_completion: Optional[TaskComplete] = None,
 ):
-    task = db.get(Task, task_id)
+    # Load the task with its parent session in one joined query; the
+    # authorization check below would otherwise lazy-load the session.
+    task = db.exec(
+        select(Task)
+        .where(Task.id == task_id)
+        .options(joinedload(Task.session))
+    ).first()
     if not task or task.is_deleted:
         raise HTTPException(status_code=404, detail="Task not found")
-    
+
     # Check if task belongs to user's session
     if task.session and task.session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to modify this task")
-    
+
+    # Idempotent fast path: client retries of an already-completed task skip
+    # the writes and analytics entirely unless they change the actual time.
+    if task.completed and (
+        task_completion is None
+        or task_completion.actual_completion_time is None
+        or task_completion.actual_completion_time == task.actual_completion_time
+    ):
+        return {"message": "Task already completed"}
+
+    now = datetime.utcnow()
     task.completed = True
-    task.completed_at = datetime.utcnow()
+    task.completed_at = now
     # Treat completed task as archived
     task.archived = True
-    task.archived_at = datetime.utcnow()
+    task.archived_at = now
     
     # Set actual completion time from request or default to estimated
     if task_completion and task_completion.actual_completion_time is not None:
@@ -1090,10 +1365,9 @@ def complete_task(
         task.actual_completion_time = task.estimated_completion_time
     
     db.add(task)
-    db.commit()
-    
-    # Log task completion analytics event
-    AnalyticsService.log_event(
+
+    # Queue the completion event so it rides in the same commit as the task
+    AnalyticsService.queue_event(
         db=db,
         user_id=current_user.id,
         event_type="task_complete",
@@ -1106,25 +1380,40 @@ def complete_task(
             "completion_time": task.completed_at.isoformat()
         }
     )
+    db.commit()
     
-    # Update session analytics if available
+    # Update session analytics after the response is sent; the aggregate
+    # row is never read back in this request.
     if task.session_id:
-        AnalyticsService.update_session_analytics(
-            db=db,
+        completed_count = db.exec(
+            select(func.count())
+            .select_from(Task)
+            .where(Task.session_id == task.session_id, Task.completed == True)  # noqa: E712
+        ).one()
+        background_tasks.add_task(
+            AnalyticsService.update_session_analytics_background,
             session_id=task.session_id,
-            tasks_completed=len([t for t in task.session.tasks if t.completed])
+            tasks_completed=completed_count,
         )
     
+    _invalidate_progress_cache(current_user.id)
     return {"message": "Task completed successfully"}
 
 
-@router.put("/tasks/{task_id}/uncomplete", response_model=dict)
+@router.put("/tasks/{task_id}/uncomplete")
 def uncomplete_task(
     db: SessionDep,
     task_id: int,
     current_user: ActiveUserDep,
+    background_tasks: BackgroundTasks,
 ):
-    task = db.get(Task, task_id)
+    # Load the task with its parent session in one joined query; the
+    # authorization check below would otherwise lazy-load the session.
+    task = db.exec(
+        select(Task)
+        .where(Task.id == task_id)
+        .options(joinedload(Task.session))
+    ).first()
     if not task or task.is_deleted:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -1132,6 +1421,10 @@ def uncomplete_task(
     if task.session and task.session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to modify this task")
     
+    # Idempotent fast path mirroring complete_task: nothing to undo
+    if not task.completed:
+        return {"message": "Task already incomplete", "session_reset": False}
+
     # Get the session to check if it's completed
     session = task.session
     was_session_completed = session.completed if session else False
@@ -1153,7 +1446,7 @@ def uncomplete_task(
         db.add(session)
         
         # Log session reset analytics event
-        AnalyticsService.log_event(
+        AnalyticsService.queue_event(
             db=db,
             user_id=current_user.id,
             event_type="session_reset",
@@ -1166,10 +1459,8 @@ def uncomplete_task(
             }
         )
     
-    db.commit()
-    
-    # Log task uncompletion analytics event
-    AnalyticsService.log_event(
+    # Queue the uncompletion event so it rides in the same commit
+    AnalyticsService.queue_event(
         db=db,
         user_id=current_user.id,
         event_type="task_uncomplete",
@@ -1181,15 +1472,23 @@ def uncomplete_task(
             "session_reset": was_session_completed
         }
     )
+    db.commit()
     
-    # Update session analytics if available
+    # Update session analytics after the response is sent; the aggregate
+    # row is never read back in this request.
     if task.session_id:
-        AnalyticsService.update_session_analytics(
-            db=db,
+        completed_count = db.exec(
+            select(func.count())
+            .select_from(Task)
+            .where(Task.session_id == task.session_id, Task.completed == True)  # noqa: E712
+        ).one()
+        background_tasks.add_task(
+            AnalyticsService.update_session_analytics_background,
             session_id=task.session_id,
-            tasks_completed=len([t for t in task.session.tasks if t.completed])
+            tasks_completed=completed_count,
         )
     
+    _invalidate_progress_cache(current_user.id)
     return {"message": "Task uncompleted successfully", "session_reset": was_session_completed}
 
 
@@ -1199,6 +1498,7 @@ def complete_session(
     feedback_data: SessionCompleteRequest,
     db: SessionDep,
     current_user: ActiveUserDep,
+    background_tasks: BackgroundTasks,
 ):
     """Complete a session and submit feedback"""
     
@@ -1215,25 +1515,40 @@ def complete_session(
     if session.completed:
         raise HTTPException(status_code=400, detail="Session already completed")
     
-    # Mark session as completed
+    # Mark session as completed. One clock read keeps the session and all
+    # auto-completed tasks on the same timestamp.
+    now = datetime.utcnow()
     session.completed = True
-    session.completed_at = datetime.utcnow()
-    
-    # Mark ALL tasks as completed when session is completed
-    incomplete_tasks = []
-    for task in (t for t in session.tasks if not t.is_deleted):
-        if not task.completed:
-            task.completed = True
-            task.completed_at = datetime.utcnow()
-            incomplete_tasks.append(task.id)
-        # Ensure all tasks (newly or previously completed) are archived
-        task.archived = True
-        if not task.archived_at:
-            task.archived_at = datetime.utcnow()
+    session.completed_at = now
+    
+    # Capture which tasks get auto-completed for the analytics event, then
+    # complete and archive every live task in one bulk UPDATE instead of
+    # loading the collection and flushing a row at a time. COALESCE keeps
+    # timestamps already set by earlier completions/archives.
+    incomplete_tasks = db.exec(
+        select(Task.id).where(
+            Task.session_id == session_id,
+            Task.is_deleted == False,  # noqa: E712
+            Task.completed == False,  # noqa: E712
+        )
+    ).all()
+    db.execute(
+        update(Task)
+        .where(
+            Task.session_id == session_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .values(
+            completed=True,
+            completed_at=func.coalesce(Task.completed_at, now),
+            archived=True,
+            archived_at=func.coalesce(Task.archived_at, now),
+        )
+    )
     
     # Log which tasks were auto-completed
     if incomplete_tasks:
-        AnalyticsService.log_event(
+        AnalyticsService.queue_event(
             db=db,
             user_id=current_user.id,
             event_type="tasks_auto_completed",
@@ -1244,10 +1559,23 @@ def complete_session(
             }
         )
     
-    # Calculate session statistics (all tasks are now completed)
-    completed_tasks = len([t for t in session.tasks if not t.is_deleted])
+    # Calculate session statistics (all tasks are now completed) without
+    # hydrating the task collection
+    completed_tasks = db.exec(
+        select(func.count())
+        .select_from(Task)
+        .where(
+            Task.session_id == session_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+    ).one()
     failed_tasks = 0  # No failed tasks since we completed all
-    total_focus_time = sum(task.actual_completion_time or 0 for task in session.tasks if task.completed)
+    total_focus_time = db.exec(
+        select(func.coalesce(func.sum(Task.actual_completion_time), 0)).where(
+            Task.session_id == session_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+    ).one()
     focus_duration_minutes = total_focus_time // 60
     
     # Create feedback record
@@ -1262,11 +1590,9 @@ def complete_session(
     )
     
     db.add(feedback)
-    db.commit()
-    db.refresh(feedback)
-    
-    # Log analytics event for session completion
-    AnalyticsService.log_event(
+
+    # Queue the completion event alongside the feedback row
+    AnalyticsService.queue_event(
         db=db,
         user_id=current_user.id,
         event_type="session_complete",
@@ -1278,16 +1604,8 @@ def complete_session(
             "focus_duration_minutes": focus_duration_minutes,
         }
     )
-    
-    # Update session analytics
-    AnalyticsService.update_session_analytics(
-        db=db,
-        session_id=session_id,
-        tasks_completed=completed_tasks,
-        session_ended_at=session.completed_at
-    )
-    
-    return SessionFeedbackPublic(
+    db.flush()  # assigns feedback.id without the post-commit refresh SELECT
+    feedback_response = SessionFeedbackPublic.model_construct(
         id=feedback.id,
         session_id=feedback.session_id,
         focus_level=feedback.focus_level,
@@ -1297,33 +1615,81 @@ def complete_session(
         focus_duration_minutes=feedback.focus_duration_minutes,
         created_at=feedback.created_at,
     )
+    db.commit()
+    
+    # Update session analytics off the request path
+    background_tasks.add_task(
+        AnalyticsService.update_session_analytics_background,
+        session_id=session_id,
+        tasks_completed=completed_tasks,
+        session_ended_at=now,
+    )
+    
+    _invalidate_progress_cache(current_user.id)
+    return feedback_response
+
+
+_FEEDBACK_LIST_ADAPTER = TypeAdapter(List[SessionFeedbackPublic])
 
 
-@router.get("/feedback", response_model=List[SessionFeedbackPublic])
+@router.get("/feedback", responses={200: {"model": List[SessionFeedbackPublic]}})
 def get_session_feedbacks(
     db: SessionDep,
     current_user: ActiveUserDep,
     limit: int = 50,
+    before: Optional[datetime] = None,
 ):
-    """Get session feedback history for the current user"""
+    """Get session feedback history for the current user.
+
+    Pass the created_at of the last row from the previous page as `before`
+    to keyset-paginate; each page stays O(limit) regardless of depth,
+    unlike an OFFSET which scans and discards earlier rows.
+    """
     
+    query = select(SessionFeedback).where(SessionFeedback.user_id == current_user.id)
+    if before is not None:
+        query = query.where(SessionFeedback.created_at < before)
     feedbacks = db.exec(
-        select(SessionFeedback)
-        .where(SessionFeedback.user_id == current_user.id)
-        .order_by(SessionFeedback.created_at.desc())
-        .limit(limit)
+        query.order_by(SessionFeedback.created_at.desc()).limit(limit)
     ).all()
     
-    return [
-        SessionFeedbackPublic(
-            id=feedback.id,
-            session_id=feedback.session_id,
-            focus_level=feedback.focus_level,
-            session_reflection=feedback.session_reflection,
-            tasks_completed=feedback.tasks_completed,
-            tasks_failed=feedback.tasks_failed,
-            focus_duration_minutes=feedback.focus_duration_minutes,
-            created_at=feedback.created_at,
-        )
-        for feedback in feedbacks
-    ]
+    # Serialize the whole list in one pass through Pydantic's Rust serializer
+    # instead of constructing a model and re-encoding each row individually.
+    return Response(
+        content=_FEEDBACK_LIST_ADAPTER.dump_json(
+            [
+                SessionFeedbackPublic.model_construct(
+                    id=feedback.id,
+                    session_id=feedback.session_id,
+                    focus_level=feedback.focus_level,
+                    session_reflection=feedback.session_reflection,
+                    tasks_completed=feedback.tasks_completed,
+                    tasks_failed=feedback.tasks_failed,
+                    focus_duration_minutes=feedback.focus_duration_minutes,
+                    created_at=feedback.created_at,
+                )
+                for feedback in feedbacks
+            ]
+        ),
+        media_type="application/json",
+    )
+
+
+def _warm_serializers() -> None:
+    """Build Pydantic schemas/serializers at import instead of first request.
+
+    Schema and serializer compilation is lazy; without this the first
+    request after a worker (re)start pays the full build cost.
+    """
+    for model in (
+        SessionWithTasksPublic,
+        TaskPublic,
+        SessionPublic,
+        ActiveSessionPublic,
+        SessionFeedbackPublic,
+    ):
+        model.model_rebuild()
+        model.model_json_schema()
+
+
+_warm_serializers()
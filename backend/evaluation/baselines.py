@@ -7,13 +7,17 @@ Implements classical scheduling heuristics:
 - SPT: Shortest Processing Time first
 - EDD: Earliest Due Date first
 - WSPT: Weighted Shortest Processing Time (w = cognitive_load²)
+
+Schedulers treat their input as immutable: each returns a new list holding
+the same TaskData references, never copies.
 """
 
 from typing import List, Callable
 import random as rnd
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from copy import deepcopy
+
+import numpy as np
 
 
 @dataclass
@@ -28,11 +32,12 @@ class TaskData:
     session_id: int | None
     order: int
     completed: bool = False
+    # Quadratic weight mapping (w = c²), precomputed once instead of a
+    # property re-evaluated on every metrics/WSPT access.
+    weight: float = field(init=False, repr=False)
 
-    @property
-    def weight(self) -> float:
-        """Quadratic weight mapping: w = c²"""
-        return self.cognitive_load**2
+    def __post_init__(self) -> None:
+        self.weight = float(self.cognitive_load) ** 2
 
 
 def random_scheduler(tasks: List[TaskData], seed: int | None = None) -> List[TaskData]:
@@ -44,13 +49,78 @@ def random_scheduler(tasks: List[TaskData], seed: int | None = None) -> List[Tas
     Time Complexity: O(n)
     Optimizes: Nothing
     """
-    result = deepcopy(tasks)
+    result = list(tasks)
     if seed is not None:
         rnd.seed(seed)
     rnd.shuffle(result)
     return result
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class TaskBatch:
+    """Struct-of-arrays view of one session's tasks.
+
+    Built once per session and shared by every scheduler and metrics call,
+    so per-field dataclass reads become contiguous array indexing. The
+    original TaskData objects are kept for callers that need them back.
+    """
+
+    tasks: List[TaskData]
+    ids: np.ndarray  # int64
+    durations: np.ndarray  # float64, minutes
+    weights: np.ndarray  # float64, cognitive_load²
+    cloads: np.ndarray  # float64
+    due_ts: np.ndarray  # float64 seconds since epoch, NaN when no due date
+
+    @classmethod
+    def from_tasks(cls, tasks: List[TaskData]) -> "TaskBatch":
+        n = len(tasks)
+        return cls(
+            tasks=list(tasks),
+            ids=np.fromiter((t.id for t in tasks), dtype=np.int64, count=n),
+            durations=np.fromiter(
+                (t.estimated_completion_time for t in tasks),
+                dtype=np.float64,
+                count=n,
+            ),
+            weights=np.fromiter((t.weight for t in tasks), dtype=np.float64, count=n),
+            cloads=np.fromiter(
+                (t.cognitive_load for t in tasks), dtype=np.float64, count=n
+            ),
+            due_ts=np.array(
+                [
+                    (t.due_date - _EPOCH).total_seconds()
+                    if t.due_date is not None
+                    else np.nan
+                    for t in tasks
+                ],
+                dtype=np.float64,
+            ),
+        )
+
+    def take(self, perm: np.ndarray) -> List[TaskData]:
+        """Materialize a permutation back into a TaskData schedule."""
+        return [self.tasks[i] for i in perm]
+
+
+def _argsort_by(
+    tasks: List[TaskData], values: np.ndarray, descending: bool = False
+) -> List[TaskData]:
+    """Reorder tasks by a NumPy key array via stable argsort.
+
+    The sort kernel runs in C on primitive keys instead of calling a Python
+    ``key=`` lambda per element. Descending order negates the keys, so ties
+    keep their original relative order exactly like ``sorted`` does.
+    """
+    if descending:
+        values = -values
+    idx = np.argsort(values, kind="stable")
+    return [tasks[i] for i in idx]
+
+
 def fcfs_scheduler(tasks: List[TaskData]) -> List[TaskData]:
     """
     First-Come-First-Served (FCFS)
@@ -60,7 +130,9 @@ def fcfs_scheduler(tasks: List[TaskData]) -> List[TaskData]:
     Time Complexity: O(n log n)
     Optimizes: Fairness
     """
-    return sorted(deepcopy(tasks), key=lambda t: t.id)
+    return _argsort_by(
+        tasks, np.fromiter((t.id for t in tasks), dtype=np.int64, count=len(tasks))
+    )
 
 
 def spt_scheduler(tasks: List[TaskData]) -> List[TaskData]:
@@ -75,7 +147,14 @@ def spt_scheduler(tasks: List[TaskData]) -> List[TaskData]:
 
     Reference: Smith (1956)
     """
-    return sorted(deepcopy(tasks), key=lambda t: t.estimated_completion_time)
+    return _argsort_by(
+        tasks,
+        np.fromiter(
+            (t.estimated_completion_time for t in tasks),
+            dtype=np.int64,
+            count=len(tasks),
+        ),
+    )
 
 
 def lpt_scheduler(tasks: List[TaskData]) -> List[TaskData]:
@@ -86,7 +165,15 @@ def lpt_scheduler(tasks: List[TaskData]) -> List[TaskData]:
 
     Time Complexity: O(n log n)
     """
-    return sorted(deepcopy(tasks), key=lambda t: -t.estimated_completion_time)
+    return _argsort_by(
+        tasks,
+        np.fromiter(
+            (t.estimated_completion_time for t in tasks),
+            dtype=np.int64,
+            count=len(tasks),
+        ),
+        descending=True,
+    )
 
 
 def edd_scheduler(tasks: List[TaskData]) -> List[TaskData]:
@@ -102,12 +189,13 @@ def edd_scheduler(tasks: List[TaskData]) -> List[TaskData]:
 
     Reference: Jackson's Rule (1955)
     """
-    tasks_copy = deepcopy(tasks)
-    with_deadline = [t for t in tasks_copy if t.due_date is not None]
-    without_deadline = [t for t in tasks_copy if t.due_date is None]
-
-    sorted_with_deadline = sorted(with_deadline, key=lambda t: t.due_date)
-    return sorted_with_deadline + without_deadline
+    # Missing due dates become +inf so the stable sort leaves them trailing
+    # in their original order, matching the old two-list split.
+    due = np.array(
+        [t.due_date.timestamp() if t.due_date is not None else np.inf for t in tasks],
+        dtype=np.float64,
+    )
+    return _argsort_by(tasks, due)
 
 
 def wspt_scheduler(tasks: List[TaskData]) -> List[TaskData]:
@@ -123,12 +211,13 @@ def wspt_scheduler(tasks: List[TaskData]) -> List[TaskData]:
 
     Reference: Smith (1956)
     """
-
-    def ratio(t: TaskData) -> float:
-        duration = max(1, t.estimated_completion_time)
-        return t.weight / duration
-
-    return sorted(deepcopy(tasks), key=ratio, reverse=True)
+    weights = np.fromiter((t.weight for t in tasks), dtype=np.float64, count=len(tasks))
+    durations = np.fromiter(
+        (max(1, t.estimated_completion_time) for t in tasks),
+        dtype=np.float64,
+        count=len(tasks),
+    )
+    return _argsort_by(tasks, weights / durations, descending=True)
 
 
 def cls_ascending_scheduler(tasks: List[TaskData]) -> List[TaskData]:
@@ -139,7 +228,10 @@ def cls_ascending_scheduler(tasks: List[TaskData]) -> List[TaskData]:
 
     Time Complexity: O(n log n)
     """
-    return sorted(deepcopy(tasks), key=lambda t: t.cognitive_load)
+    return _argsort_by(
+        tasks,
+        np.fromiter((t.cognitive_load for t in tasks), dtype=np.int64, count=len(tasks)),
+    )
 
 
 def cls_descending_scheduler(tasks: List[TaskData]) -> List[TaskData]:
@@ -150,7 +242,70 @@ def cls_descending_scheduler(tasks: List[TaskData]) -> List[TaskData]:
 
     Time Complexity: O(n log n)
     """
-    return sorted(deepcopy(tasks), key=lambda t: -t.cognitive_load)
+    return _argsort_by(
+        tasks,
+        np.fromiter((t.cognitive_load for t in tasks), dtype=np.int64, count=len(tasks)),
+        descending=True,
+    )
+
+
+def random_permutation(n: int, seed: int | None = None) -> np.ndarray:
+    """Index permutation matching random_scheduler's shuffle for the same seed."""
+    perm = list(range(n))
+    if seed is not None:
+        rnd.seed(seed)
+    rnd.shuffle(perm)
+    return np.asarray(perm, dtype=np.int64)
+
+
+def random_permutation_batch(n: int, num_runs: int, seed: int = 0) -> np.ndarray:
+    """Generate num_runs independent random permutations as one (num_runs, n) array.
+
+    A single vectorized rng.permuted call replaces num_runs Python-level
+    Fisher-Yates shuffles; rows feed straight into the batched metrics kernel.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.permuted(np.tile(np.arange(n, dtype=np.int64), (num_runs, 1)), axis=1)
+
+
+def random_scheduler_batch(
+    tasks: List[TaskData], num_runs: int, seed: int = 0
+) -> List[List[TaskData]]:
+    """List-of-schedules wrapper over random_permutation_batch."""
+    return [
+        [tasks[j] for j in row]
+        for row in random_permutation_batch(len(tasks), num_runs, seed)
+    ]
+
+
+def fcfs_permutation(batch: TaskBatch) -> np.ndarray:
+    return np.argsort(batch.ids, kind="stable")
+
+
+def spt_permutation(batch: TaskBatch) -> np.ndarray:
+    return np.argsort(batch.durations, kind="stable")
+
+
+def lpt_permutation(batch: TaskBatch) -> np.ndarray:
+    return np.argsort(-batch.durations, kind="stable")
+
+
+def edd_permutation(batch: TaskBatch) -> np.ndarray:
+    due = np.where(np.isnan(batch.due_ts), np.inf, batch.due_ts)
+    return np.argsort(due, kind="stable")
+
+
+def wspt_permutation(batch: TaskBatch) -> np.ndarray:
+    ratios = batch.weights / np.maximum(batch.durations, 1.0)
+    return np.argsort(-ratios, kind="stable")
+
+
+def cls_ascending_permutation(batch: TaskBatch) -> np.ndarray:
+    return np.argsort(batch.cloads, kind="stable")
+
+
+def cls_descending_permutation(batch: TaskBatch) -> np.ndarray:
+    return np.argsort(-batch.cloads, kind="stable")
 
 
 # Registry of all baseline schedulers
@@ -165,6 +320,18 @@ BASELINE_SCHEDULERS: dict[str, Callable] = {
     "CLS_DESC": cls_descending_scheduler,
 }
 
+# Permutation-returning variants of the deterministic baselines: they take a
+# shared TaskBatch and return index arrays for the batched metrics kernel.
+PERMUTATION_SCHEDULERS: dict[str, Callable[[TaskBatch], "np.ndarray"]] = {
+    "FCFS": fcfs_permutation,
+    "SPT": spt_permutation,
+    "LPT": lpt_permutation,
+    "EDD": edd_permutation,
+    "WSPT": wspt_permutation,
+    "CLS_ASC": cls_ascending_permutation,
+    "CLS_DESC": cls_descending_permutation,
+}
+
 # Deterministic baselines (don't need multiple runs)
 DETERMINISTIC_BASELINES = {"FCFS", "SPT", "LPT", "EDD", "WSPT", "CLS_ASC", "CLS_DESC"}
 STOCHASTIC_BASELINES = {"RND"}
@@ -0,0 +1,57 @@
+"""Per-session memoization of deterministic baseline permutations.
+
+The deterministic baselines always produce the same ordering for a given
+session's task list, but multi-figure workflows re-run them every time a
+cohort or session is revisited. Results are cached keyed by
+(session_id, algorithm_name); stochastic baselines (RND) are never cached
+because their whole point is run-to-run variation.
+"""
+
+from typing import List
+
+import numpy as np
+
+from .baselines import (
+    PERMUTATION_SCHEDULERS,
+    STOCHASTIC_BASELINES,
+    TaskBatch,
+    TaskData,
+)
+
+_perm_cache: dict[tuple[int, str], np.ndarray] = {}
+
+
+def clear_permutation_cache() -> None:
+    _perm_cache.clear()
+
+
+def get_deterministic_permutation(
+    session_id: int, alg_name: str, batch: TaskBatch
+) -> np.ndarray:
+    """Return the cached permutation for (session_id, alg_name), computing it once.
+
+    A cached entry whose length no longer matches the batch (the session's
+    tasks changed) is recomputed rather than served stale.
+    """
+    if alg_name in STOCHASTIC_BASELINES:
+        raise ValueError(f"{alg_name} is stochastic and must not be cached")
+
+    key = (session_id, alg_name)
+    perm = _perm_cache.get(key)
+    if perm is None or len(perm) != len(batch.tasks):
+        perm = PERMUTATION_SCHEDULERS[alg_name](batch)
+        _perm_cache[key] = perm
+    return perm
+
+
+def get_deterministic_schedule(
+    session_id: int, alg_name: str, tasks: List[TaskData]
+) -> List[TaskData]:
+    """TaskData-list convenience wrapper for the cohort evaluation flows."""
+    key = (session_id, alg_name)
+    perm = _perm_cache.get(key)
+    if perm is None or len(perm) != len(tasks):
+        perm = get_deterministic_permutation(
+            session_id, alg_name, TaskBatch.from_tasks(tasks)
+        )
+    return [tasks[i] for i in perm]
@@ -79,6 +79,42 @@ def load_user_sessions(db_path: str) -> Dict[int, List[int]]:
     return user_sessions
 
 
+def load_user_cohort_labels(
+    db_path: str, p33: float, p66: float
+) -> List[Tuple[int, int]]:
+    """Assign each user a cohort index (0=High, 1=Medium, 2=Low) in SQL.
+
+    The per-user rate and the three-way percentile branch both run inside
+    SQLite's CASE evaluation, so Python only sees final (user_id, cohort)
+    rows instead of branching over every user.
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        WITH per_user AS (
+            SELECT u.id AS user_id,
+                   CAST(COALESCE(SUM(CASE WHEN t.completed = 1 THEN 1 ELSE 0 END), 0) AS REAL)
+                       / COUNT(t.id) AS rate
+            FROM user u
+            LEFT JOIN session s ON s.user_id = u.id AND s.is_deleted = 0
+            LEFT JOIN task t ON t.session_id = s.id AND t.is_deleted = 0
+            GROUP BY u.id
+            HAVING COUNT(t.id) > 0
+        )
+        SELECT user_id,
+               CASE WHEN rate >= ? THEN 0 WHEN rate >= ? THEN 1 ELSE 2 END
+        FROM per_user
+    """,
+        (p66, p33),
+    )
+
+    labels = cursor.fetchall()
+    conn.close()
+    return labels
+
+
 def create_user_cohorts(db_path: str) -> List[UserCohort]:
     rates = load_user_completion_rates(db_path)
     user_sessions = load_user_sessions(db_path)
@@ -96,16 +132,9 @@ def create_user_cohorts(db_path: str) -> List[UserCohort]:
         UserCohort("Low Performers", [], [], (0.0, p33)),
     ]
 
-    for user_id, rate in rates.items():
-        if rate >= p66:
-            cohorts[0].user_ids.append(user_id)
-            cohorts[0].session_ids.extend(user_sessions.get(user_id, []))
-        elif rate >= p33:
-            cohorts[1].user_ids.append(user_id)
-            cohorts[1].session_ids.extend(user_sessions.get(user_id, []))
-        else:
-            cohorts[2].user_ids.append(user_id)
-            cohorts[2].session_ids.extend(user_sessions.get(user_id, []))
+    for user_id, cohort_idx in load_user_cohort_labels(db_path, p33, p66):
+        cohorts[cohort_idx].user_ids.append(user_id)
+        cohorts[cohort_idx].session_ids.extend(user_sessions.get(user_id, []))
 
     return cohorts
 
@@ -1,10 +1,13 @@
 """Schedule quality metrics: TWT, TCT, OTR, Momentum, Makespan."""
 
+import bisect
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List
 
-from .baselines import TaskData
+import numpy as np
+
+from .baselines import _EPOCH, TaskBatch, TaskData
 
 
 @dataclass
@@ -24,7 +27,24 @@ class ScheduleMetrics:
 def compute_schedule_metrics(
     schedule: List[TaskData], start_time: datetime | None = None
 ) -> ScheduleMetrics:
-    if not schedule:
+    """Thin adapter over the batched kernel for TaskData-list callers."""
+    batch = TaskBatch.from_tasks(schedule)
+    return compute_schedule_metrics_batch(
+        batch, np.arange(len(schedule), dtype=np.int64), start_time
+    )
+
+
+def compute_schedule_metrics_batch(
+    batch: TaskBatch, perm: np.ndarray, start_time: datetime | None = None
+) -> ScheduleMetrics:
+    """Compute metrics for one permutation of a shared TaskBatch.
+
+    All per-task quantities are array reductions over the batch's
+    struct-of-arrays columns indexed by ``perm``, so benchmarking many
+    orderings of the same session reuses one field-extraction pass.
+    """
+    n = len(perm)
+    if n == 0:
         return ScheduleMetrics(
             total_weighted_tardiness=0.0,
             total_completion_time=0.0,
@@ -41,50 +61,31 @@ def compute_schedule_metrics(
     if start_time is None:
         start_time = datetime.now()
 
-    n = len(schedule)
-    current_time = start_time
-
-    twt = 0.0
-    tct = 0.0
-    wct = 0.0
-    tardy_count = 0
-    mi = 0.0
-    csc = 0.0
-    max_lateness = float("-inf")
+    durations = batch.durations[perm]
+    weights = batch.weights[perm]
+    loads = batch.cloads[perm]
+    start_ts = (start_time - _EPOCH).total_seconds()
+    due_min = (batch.due_ts[perm] - start_ts) / 60  # NaN propagates for no due date
 
-    for k, task in enumerate(schedule):
-        current_time += timedelta(minutes=task.estimated_completion_time)
+    completion = np.cumsum(durations)  # minutes after start_time
 
-        elapsed_minutes = (current_time - start_time).total_seconds() / 60
-        weight = task.weight
+    has_due = ~np.isnan(due_min)
+    lateness = completion[has_due] - due_min[has_due]
+    twt = float(np.sum(weights[has_due] * np.maximum(lateness, 0.0)))
+    tardy_count = int(np.count_nonzero(lateness > 0))
+    max_lateness = float(lateness.max()) if lateness.size else 0.0
 
-        if task.due_date:
-            lateness = (current_time - task.due_date).total_seconds() / 60
-            tardiness = max(0, lateness)
-            is_tardy = 1 if lateness > 0 else 0
+    tct = float(completion.sum())
+    wct = float(np.sum(weights * completion))
 
-            twt += weight * tardiness
-            tardy_count += is_tardy
-            max_lateness = max(max_lateness, lateness)
+    position_weights = np.arange(n, 0, -1, dtype=np.float64)
+    mi = float(np.sum(position_weights / np.maximum(durations, 1.0)))
+    csc = float(np.sum(np.abs(np.diff(loads)))) if n > 1 else 0.0
 
-        tct += elapsed_minutes
-        wct += weight * elapsed_minutes
-
-        position_weight = n - k
-        mi += position_weight / max(1, task.estimated_completion_time)
-
-        if k > 0:
-            prev_load = schedule[k - 1].cognitive_load
-            curr_load = task.cognitive_load
-            csc += abs(curr_load - prev_load)
-
-    makespan = (current_time - start_time).total_seconds() / 60
+    makespan = float(completion[-1])
     otr = (n - tardy_count) / n if n > 0 else 1.0
     mi_normalized = mi / n if n > 0 else 0.0
 
-    if max_lateness == float("-inf"):
-        max_lateness = 0.0
-
     return ScheduleMetrics(
         total_weighted_tardiness=twt,
         total_completion_time=tct,
@@ -106,13 +107,23 @@ def compute_improvement_ratio(baseline_value: float, ga_value: float) -> float:
 
 
 def cliffs_delta(x: List[float], y: List[float]) -> tuple[float, str]:
-    """Cliff's delta effect size: P(X > Y) - P(X < Y)."""
+    """Cliff's delta effect size: P(X > Y) - P(X < Y).
+
+    Counts pairs via binary search on a sorted copy of y, so the cost is
+    O((n_x + n_y) log n_y) instead of the O(n_x * n_y) pairwise scan.
+    """
     if not x or not y:
         return 0.0, "negligible"
 
     n_x, n_y = len(x), len(y)
-    more = sum(1 for xi in x for yj in y if xi > yj)
-    less = sum(1 for xi in x for yj in y if xi < yj)
+    ys = sorted(y)
+    more = 0
+    less = 0
+    for xi in x:
+        # Elements of y strictly below xi count toward "more" (xi > yj),
+        # those strictly above toward "less".
+        more += bisect.bisect_left(ys, xi)
+        less += n_y - bisect.bisect_right(ys, xi)
 
     delta = (more - less) / (n_x * n_y)
 
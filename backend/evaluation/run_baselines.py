@@ -1,43 +1,76 @@
 #!/usr/bin/env python3
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from evaluation.baselines import TaskData, BASELINE_SCHEDULERS, random_scheduler
-from evaluation.metrics import compute_schedule_metrics, cliffs_delta
-from evaluation.runner import load_tasks_from_db, load_all_sessions
+from evaluation.baselines import (
+    TaskData,
+    TaskBatch,
+    random_permutation_batch,
+    random_scheduler,
+)
+from evaluation.cache import get_deterministic_permutation
+from evaluation.metrics import (
+    compute_schedule_metrics,
+    compute_schedule_metrics_batch,
+    cliffs_delta,
+)
+from evaluation.runner import (
+    load_tasks_from_db,
+    load_tasks_for_sessions,
+    load_all_sessions,
+)
 
 DB_PATH = Path(__file__).parent.parent / "database.db"
 
 
-def run_single_session_benchmark(session_id: int, num_runs: int = 30):
-    tasks = load_tasks_from_db(str(DB_PATH), session_id)
+def run_single_session_benchmark(session_id: int, num_runs: int = 30, tasks=None):
+    if tasks is None:
+        tasks = load_tasks_from_db(str(DB_PATH), session_id)
     if len(tasks) < 3:
         return None
 
     start_time = datetime.now()
     results = {}
 
+    # One struct-of-arrays conversion per session; every scheduler returns a
+    # permutation of it and the metrics kernel indexes the shared columns.
+    batch = TaskBatch.from_tasks(tasks)
+
     for name in ["RND", "SPT", "EDD", "WSPT"]:
-        scheduler_fn = BASELINE_SCHEDULERS[name]
         if name == "RND":
-            metrics_list = []
-            for run in range(num_runs):
-                scheduled = scheduler_fn(tasks, seed=run * 42)
-                m = compute_schedule_metrics(scheduled, start_time)
-                metrics_list.append(m)
-            results[name] = metrics_list
+            # All num_runs shuffles come from one vectorized generator call;
+            # a fixed seed keeps the benchmark reproducible across sessions.
+            perms = random_permutation_batch(len(tasks), num_runs, seed=42)
+            results[name] = [
+                compute_schedule_metrics_batch(batch, perm, start_time)
+                for perm in perms
+            ]
         else:
-            scheduled = scheduler_fn(tasks)
-            m = compute_schedule_metrics(scheduled, start_time)
+            perm = get_deterministic_permutation(session_id, name, batch)
+            m = compute_schedule_metrics_batch(batch, perm, start_time)
             results[name] = [m]
 
     return {"session_id": session_id, "task_count": len(tasks), "results": results}
 
 
+def _bench_session(args: tuple) -> dict | None:
+    """Process-pool worker: benchmark one preloaded session.
+
+    Takes a (session_id, tasks) pair so workers never touch the database,
+    and reseeds per run inside run_single_session_benchmark, keeping the
+    parallel results identical to the sequential ones.
+    """
+    session_id, tasks = args
+    return run_single_session_benchmark(session_id, num_runs=30, tasks=tasks)
+
+
 def aggregate_across_sessions(session_results: list) -> dict:
     aggregated = {}
 
@@ -58,16 +91,16 @@ def aggregate_across_sessions(session_results: list) -> dict:
                 all_wct.append(m.weighted_completion_time)
 
         if all_twt:
+            # Array reductions instead of Python-level sums; the old std
+            # expression recomputed the mean inside the generator for every
+            # element, which was accidentally quadratic in the sample count.
+            twt = np.asarray(all_twt, dtype=np.float64)
             aggregated[alg] = {
-                "twt_mean": sum(all_twt) / len(all_twt),
-                "twt_std": (
-                    sum((x - sum(all_twt) / len(all_twt)) ** 2 for x in all_twt)
-                    / len(all_twt)
-                )
-                ** 0.5,
-                "otr_mean": sum(all_otr) / len(all_otr),
-                "momentum_mean": sum(all_momentum) / len(all_momentum),
-                "wct_mean": sum(all_wct) / len(all_wct),
+                "twt_mean": float(twt.mean()),
+                "twt_std": float(twt.std(ddof=0)),
+                "otr_mean": float(np.mean(all_otr)),
+                "momentum_mean": float(np.mean(all_momentum)),
+                "wct_mean": float(np.mean(all_wct)),
                 "n_samples": len(all_twt),
             }
 
@@ -102,11 +135,18 @@ def main():
     print(f"\nRunning baseline benchmarks...")
     session_results = []
 
-    for i, sid in enumerate(session_ids):
-        result = run_single_session_benchmark(sid, num_runs=30)
-        if result:
-            session_results.append(result)
-            print(f"  Session {sid}: {result['task_count']} tasks")
+    # One IN (...) query for every session's tasks instead of a query (and a
+    # fresh connection) per session inside the loop.
+    tasks_by_session = load_tasks_for_sessions(str(DB_PATH), session_ids)
+
+    # Sessions are independent units of work (preloaded tasks, deterministic
+    # per-run seeds), so fan them out across cores; map() preserves order.
+    work = [(sid, tasks_by_session.get(sid, [])) for sid in session_ids]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for result in executor.map(_bench_session, work, chunksize=4):
+            if result:
+                session_results.append(result)
+                print(f"  Session {result['session_id']}: {result['task_count']} tasks")
 
     print(f"\nCompleted {len(session_results)} session benchmarks")
 
@@ -142,6 +142,60 @@ def load_tasks_from_db(db_path: str, session_id: int) -> List[TaskData]:
     return tasks
 
 
+def load_tasks_for_sessions(
+    db_path: str, session_ids: List[int]
+) -> dict[int, List[TaskData]]:
+    """Load the tasks of several sessions with a single query.
+
+    One connection and one ``session_id IN (...)`` scan instead of a
+    round-trip per session; rows are grouped client-side so callers get the
+    same per-session lists ``load_tasks_from_db`` would return.
+    """
+    if not session_ids:
+        return {}
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    placeholders = ",".join("?" * len(session_ids))
+    cursor.execute(
+        f"""
+        SELECT id, name, session_id, estimated_completion_time, due_date,
+               cognitive_load, completed, "order"
+        FROM task
+        WHERE session_id IN ({placeholders}) AND is_deleted = 0
+        ORDER BY session_id, "order"
+    """,
+        list(session_ids),
+    )
+
+    tasks_by_session: dict[int, List[TaskData]] = {sid: [] for sid in session_ids}
+    for row in cursor.fetchall():
+        due_date = None
+        if row["due_date"]:
+            try:
+                due_date = datetime.fromisoformat(row["due_date"])
+            except (ValueError, TypeError):
+                pass
+
+        tasks_by_session[row["session_id"]].append(
+            TaskData(
+                id=row["id"],
+                name=row["name"],
+                estimated_completion_time=row["estimated_completion_time"],
+                due_date=due_date,
+                cognitive_load=row["cognitive_load"] or 1,
+                session_id=row["session_id"],
+                order=row["order"],
+                completed=bool(row["completed"]),
+            )
+        )
+
+    conn.close()
+    return tasks_by_session
+
+
 def load_all_sessions(db_path: str) -> List[int]:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
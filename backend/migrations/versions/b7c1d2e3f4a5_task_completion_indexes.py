@@ -0,0 +1,32 @@
+"""task_completion_indexes
+
+Revision ID: b7c1d2e3f4a5
+Revises: 4afaa470b4cc
+Create Date: 2026-08-29 10:12:03.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1d2e3f4a5'
+down_revision: Union[str, Sequence[str], None] = '4afaa470b4cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_session_completed', ['session_id', 'completed'], unique=False)
+        batch_op.create_index('ix_task_completed_at', ['completed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_completed_at')
+        batch_op.drop_index('ix_task_session_completed')
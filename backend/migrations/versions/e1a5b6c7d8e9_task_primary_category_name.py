@@ -0,0 +1,45 @@
+"""task_primary_category_name
+
+Revision ID: e1a5b6c7d8e9
+Revises: d9e3f4a5b6c7
+Create Date: 2026-08-29 14:07:52.861204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a5b6c7d8e9'
+down_revision: Union[str, Sequence[str], None] = 'd9e3f4a5b6c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('primary_category_name', sa.String(), nullable=True))
+
+    # Backfill from the first linked category (lowest category id), matching
+    # the ordering the read endpoints have always used.
+    op.execute(
+        """
+        UPDATE task SET primary_category_name = (
+            SELECT category.name
+            FROM taskcategorylink
+            JOIN category ON category.id = taskcategorylink.category_id
+            WHERE taskcategorylink.task_id = task.id
+            ORDER BY category.id
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_column('primary_category_name')